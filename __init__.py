@@ -7,8 +7,19 @@ approach with two modeling strategies: organic (using Trimesh) and precision
 (using CadQuery).
 """
 
-from .scene import Scene
-from .objects import BaseObject, OrganicObject, PrecisionObject
-from .exporters.stl_exporter import STLExporter
+from .lazy_imports import lazy_attributes
+
+# Everything is imported on first attribute access, so importing the package
+# does not load trimesh or CadQuery/OCC until they are actually needed.
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "Scene": ".scene",
+        "BaseObject": ".objects",
+        "OrganicObject": ".objects",
+        "PrecisionObject": ".objects",
+        "STLExporter": ".exporters.stl_exporter",
+    },
+)
 
 __all__ = ["Scene", "BaseObject", "OrganicObject", "PrecisionObject", "STLExporter"]
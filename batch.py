@@ -0,0 +1,252 @@
+"""
+Headless batch export of many scenes.
+
+Usage (from the repository root):
+
+    python batch.py jobs.json --workers 8 --report report.json
+
+The job file is JSON of the form::
+
+    {
+      "jobs": [
+        {
+          "name": "man",
+          "output": "./target/man.stl",
+          "mode": "precision",
+          "mesh_backend": "cadquery",
+          "export": {"streaming": true, "instancing": true},
+          "objects": [
+            {"type": "Cube", "parameters": {"length": 15},
+             "transforms": [{"translate": [0, 0, 10]}]},
+            {"type": "Cylinder", "parameters": {"height": 18, "radius": 2},
+             "transforms": [{"rotate": {"axis": [0, 0, 1], "angle": 90}},
+                            {"translate": [-9, 0, 18]}]}
+          ]
+        }
+      ]
+    }
+
+Transforms are applied in order and may be ``translate``, ``rotate``
+(``axis``, ``angle`` in degrees, optional ``center``), ``scale`` or a 4x4
+``matrix``. Jobs run on a pool of long-lived worker processes that import
+CadQuery once at start-up; Qt and vispy are never imported. A job that
+crashes its worker process is reported as failed and the rest of the
+batch carries on.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List
+
+EXPORT_OPTIONS = ("streaming", "instancing", "incremental", "weld")
+SHARED_POOL_ATTEMPTS = 2
+
+
+def _object_types() -> Dict[str, Any]:
+    from objects import OrganicObject, PrecisionObject
+    from objects.primitives import Cube, Cylinder, Pyramid, Sphere
+
+    return {
+        "Cube": Cube,
+        "Sphere": Sphere,
+        "Cylinder": Cylinder,
+        "Pyramid": Pyramid,
+        "OrganicObject": OrganicObject,
+        "PrecisionObject": PrecisionObject,
+    }
+
+
+def _warm_worker() -> None:
+    # Pay the CadQuery/OCC import once per worker instead of once per job.
+    _object_types()
+
+
+def _apply_transform(obj, transform: Dict[str, Any]) -> None:
+    if len(transform) != 1:
+        raise ValueError(f"Transform must have exactly one operation: {transform}")
+    operation, value = next(iter(transform.items()))
+    if operation == "translate":
+        obj.translate(value)
+    elif operation == "rotate":
+        obj.rotate(value["axis"], value["angle"], value.get("center", (0, 0, 0)))
+    elif operation == "scale":
+        obj.scale(value)
+    elif operation == "matrix":
+        obj.apply_transform(value)
+    else:
+        raise ValueError(f"Unknown transform '{operation}'")
+
+
+def scene_from_spec(spec: Dict[str, Any]):
+    """
+    Build a ``Scene`` from one job description.
+    """
+    from scene import Scene
+
+    types = _object_types()
+    scene_obj = Scene(
+        mode=spec.get("mode", "precision"),
+        mesh_backend=spec.get("mesh_backend"),
+        triangle_budget=spec.get("triangle_budget"),
+    )
+    for entry in spec.get("objects", []):
+        object_type = types.get(entry.get("type"))
+        if object_type is None:
+            raise ValueError(f"Unknown object type '{entry.get('type')}'")
+        obj = object_type(parameters=dict(entry.get("parameters", {})))
+        for transform in entry.get("transforms", []):
+            _apply_transform(obj, transform)
+        scene_obj.add(obj)
+    return scene_obj
+
+
+def run_job(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Export one job and return its report entry. Never raises.
+    """
+    from instrumentation import Recorder
+
+    name = spec.get("name", spec.get("output"))
+    start = time.perf_counter()
+    try:
+        output = spec["output"]
+        options = spec.get("export", {})
+        unknown = set(options) - set(EXPORT_OPTIONS)
+        if unknown:
+            raise ValueError(f"Unknown export options: {sorted(unknown)}")
+        scene_obj = scene_from_spec(spec)
+        directory = os.path.dirname(output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        stats = scene_obj.export_stl(output, recorder=Recorder(), **options)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return {
+            "name": name,
+            "ok": False,
+            "seconds": time.perf_counter() - start,
+            "error": f"{type(error).__name__}: {error}",
+            "traceback": traceback.format_exc(),
+        }
+    seconds = time.perf_counter() - start
+    return {
+        "name": name,
+        "ok": True,
+        "output": output,
+        "seconds": seconds,
+        "objects": len(scene_obj.objects),
+        "triangles": stats.triangles,
+        "bytes_written": stats.bytes_written,
+        "vertices_merged": stats.vertices_merged,
+        "objects_per_second": len(scene_obj.objects) / seconds if seconds else None,
+        "triangles_per_second": stats.triangles / seconds if seconds else None,
+    }
+
+
+def _report(result: Dict[str, Any]) -> None:
+    status = "ok" if result["ok"] else f"FAILED ({result['error']})"
+    print(f"{result['name']}: {status} in {result['seconds']:.3f}s", file=sys.stderr)
+
+
+def _run_pool(
+    jobs: List[Dict[str, Any]],
+    indices: List[int],
+    workers: int,
+    results: List[Dict[str, Any]],
+) -> List[int]:
+    """
+    Run ``jobs[indices]`` on one pool, storing results as they finish.
+
+    Returns the indices whose results were lost because a worker process
+    died (e.g. an OCC segfault), which breaks the whole pool.
+    """
+    lost = []
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(indices)), initializer=_warm_worker
+    ) as pool:
+        futures = {pool.submit(run_job, jobs[index]): index for index in indices}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except BrokenProcessPool:
+                lost.append(index)
+                continue
+            _report(results[index])
+    return sorted(lost)
+
+
+def run_jobs(jobs: List[Dict[str, Any]], workers: int) -> List[Dict[str, Any]]:
+    """
+    Run ``jobs`` on ``workers`` warm processes, reporting in job order.
+
+    A crashed worker takes the pending jobs of its pool down with it, so
+    those are retried on a fresh pool; jobs lost ``SHARED_POOL_ATTEMPTS``
+    times are then run alone, where a crash is reported as that job's
+    failure instead of aborting the batch.
+    """
+    results: List[Dict[str, Any]] = [None] * len(jobs)
+    attempts = [0] * len(jobs)
+    pending = list(range(len(jobs)))
+    while pending:
+        shared = [index for index in pending if attempts[index] < SHARED_POOL_ATTEMPTS]
+        isolated = [index for index in pending if index not in shared]
+        pending = _run_pool(jobs, shared, workers, results) if shared else []
+        for index in pending:
+            attempts[index] += 1
+        for index in isolated:
+            start = time.perf_counter()
+            if _run_pool(jobs, [index], 1, results):
+                results[index] = {
+                    "name": jobs[index].get("name", jobs[index].get("output")),
+                    "ok": False,
+                    "seconds": time.perf_counter() - start,
+                    "error": "BrokenProcessPool: worker process died",
+                    "traceback": "",
+                }
+                _report(results[index])
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export many scenes headlessly.")
+    parser.add_argument("job_file", help="JSON job file")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="worker processes"
+    )
+    parser.add_argument("--report", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    with open(args.job_file, "r", encoding="utf-8") as handle:
+        jobs = json.load(handle)["jobs"]
+
+    start = time.perf_counter()
+    results = run_jobs(jobs, max(1, min(args.workers, len(jobs) or 1)))
+    elapsed = time.perf_counter() - start
+    failures = [result for result in results if not result["ok"]]
+    summary = {
+        "jobs": len(results),
+        "failed": len(failures),
+        "seconds": elapsed,
+        "jobs_per_second": len(results) / elapsed if elapsed else None,
+        "triangles": sum(result.get("triangles", 0) for result in results),
+        "results": results,
+    }
+    print(
+        f"{len(results) - len(failures)}/{len(results)} jobs succeeded in "
+        f"{elapsed:.3f}s ({summary['jobs_per_second'] or 0:.2f} jobs/s)",
+        file=sys.stderr,
+    )
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as handle:
+            json.dump(summary, handle, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
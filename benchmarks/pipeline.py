@@ -0,0 +1,179 @@
+"""
+Headless benchmarks for the build -> mesh -> combine -> export -> load path.
+
+Usage (from the repository root):
+
+    python -m benchmarks.pipeline --output bench.json
+    python -m benchmarks.pipeline --sizes 1 100 --modes organic --repeat 3
+
+Each run builds synthetic scenes of N objects, times every stage with
+``time.perf_counter`` and records the peak traced allocation with
+``tracemalloc`` (allocations made inside OCC are not visible to it, so the
+process max RSS is recorded as well). Nothing here imports Qt or vispy.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+from meshing.cache import TessellationCache, set_default_cache
+
+DEFAULT_SIZES = (1, 100, 1000, 10000)
+DEFAULT_MODES = ("organic", "precision")
+
+
+def make_objects(mode: str, count: int) -> List:
+    """
+    Synthetic scene content: organic blobs, or a mix of the CadQuery
+    primitives with varied parameters so no two neighbours share geometry.
+    """
+    if mode == "organic":
+        from objects.organic_object import OrganicObject
+
+        return [
+            OrganicObject({"radius": 1.0 + (i % 7) * 0.25, "subdivisions": 3})
+            for i in range(count)
+        ]
+    from objects.primitives import Cube, Cylinder, Pyramid, Sphere
+
+    factories = (
+        lambda i: Cube({"length": 5 + i % 11, "width": 4 + i % 5, "height": 6}),
+        lambda i: Sphere({"radius": 2 + (i % 13) * 0.5}),
+        lambda i: Cylinder({"height": 8 + i % 9, "radius": 1 + (i % 4) * 0.5}),
+        lambda i: Pyramid({"base": 6 + i % 8, "height": 5 + i % 6}),
+    )
+    return [factories[i % len(factories)](i).translate((i, 0, 0)) for i in range(count)]
+
+
+def measure(stage: Callable[[], Any], memory: bool) -> Tuple[Any, Dict[str, float]]:
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = stage()
+    elapsed = time.perf_counter() - start
+    stats = {"seconds": elapsed}
+    if memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stats["peak_bytes"] = peak
+    return result, stats
+
+
+def run_case(mode: str, count: int, workdir: str, memory: bool) -> Dict[str, Any]:
+    from exporters.stl_exporter import STLExporter
+    from viewer.lib.mesh_loader import load_mesh
+
+    exporter = STLExporter()
+    filename = os.path.join(workdir, f"{mode}-{count}.stl")
+    objects = make_objects(mode, count)
+    stages: Dict[str, Dict[str, float]] = {}
+
+    def build_all() -> None:
+        for obj in objects:
+            obj.build()
+
+    _, stages["build"] = measure(build_all, memory)
+    meshes, stages["get_mesh"] = measure(
+        lambda: [obj.get_mesh() for obj in objects], memory
+    )
+    combined, stages["combine_meshes"] = measure(
+        lambda: exporter.combine_meshes(meshes), memory
+    )
+    _, stages["export"] = measure(lambda: exporter.export(combined, filename), memory)
+    loaded, stages["load_mesh"] = measure(lambda: load_mesh(filename), memory)
+    result = {
+        "mode": mode,
+        "objects": count,
+        "triangles": int(len(combined.faces)),
+        "file_bytes": os.path.getsize(filename),
+        "loaded_triangles": int(len(loaded.faces)),
+        "stages": stages,
+    }
+    os.remove(filename)
+    return result
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "git_revision": revision,
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument(
+        "--modes", nargs="+", choices=DEFAULT_MODES, default=list(DEFAULT_MODES)
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="keep the tessellation cache enabled (off by default so every "
+        "run measures real tessellation)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        dest="memory",
+        action="store_false",
+        help="skip tracemalloc, which slows allocation-heavy stages",
+    )
+    parser.add_argument("--output", help="JSON file to write (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if not args.cache:
+        set_default_cache(TessellationCache(max_entries=0, cache_dir=None))
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="fabric6-bench-") as workdir:
+        for mode in args.modes:
+            for count in args.sizes:
+                for repeat in range(args.repeat):
+                    result = run_case(mode, count, workdir, args.memory)
+                    result["repeat"] = repeat
+                    runs.append(result)
+                    total = sum(s["seconds"] for s in result["stages"].values())
+                    print(
+                        f"{mode:9s} {count:6d} objects  {total:8.3f}s",
+                        file=sys.stderr,
+                    )
+
+    report = {
+        "environment": environment(),
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "runs": runs,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Start-up cost of the package entry points, measured with ``-X importtime``.
+
+Usage (from the repository root):
+
+    python -m benchmarks.startup --repeat 5 --output startup.json
+
+Every target statement runs in a fresh interpreter. The report lists the
+total import time, the slowest top-level imports and which heavy
+dependencies (CadQuery/OCC, Qt, vispy) ended up loaded.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("cadquery", "OCP", "trimesh", "PyQt5", "vispy")
+
+TARGETS = {
+    "scene": "from scene import Scene",
+    "organic": "from scene import Scene; from objects import OrganicObject",
+    "primitives": "from objects.primitives import Cube",
+    "batch_cli": "import batch",
+    "main_cli": "import main",
+}
+
+_PROBE = (
+    "import sys, json; {statement}; "
+    "print(json.dumps([m for m in {heavy!r} if m in sys.modules]))"
+)
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    Parse ``-X importtime`` lines into ``{"module", "self_us", "cumulative_us",
+    "depth"}`` records.
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_part, cumulative_us, name = line.split("|")
+        module = name.rstrip()
+        records.append(
+            {
+                "module": module.strip(),
+                "self_us": int(self_part.split(":")[-1]),
+                "cumulative_us": int(cumulative_us),
+                "depth": (len(module) - len(module.lstrip())) // 2,
+            }
+        )
+    return records
+
+
+def measure(statement: str) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _PROBE.format(statement=statement, heavy=HEAVY_MODULES),
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    records = parse_importtime(completed.stderr)
+    top_level = [record for record in records if record["depth"] == 0]
+    return {
+        "total_us": sum(record["cumulative_us"] for record in top_level),
+        "slowest": sorted(top_level, key=lambda r: r["cumulative_us"])[-5:][::-1],
+        "heavy_modules": json.loads(completed.stdout.strip().splitlines()[-1]),
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure package import time.")
+    parser.add_argument(
+        "--targets", nargs="+", choices=sorted(TARGETS), default=sorted(TARGETS)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="JSON file to write (default: stdout)")
+    args = parser.parse_args(argv)
+
+    report = {}
+    for target in args.targets:
+        runs = [measure(TARGETS[target]) for _ in range(args.repeat)]
+        totals = [run["total_us"] for run in runs]
+        report[target] = {
+            "statement": TARGETS[target],
+            "median_us": statistics.median(totals),
+            "min_us": min(totals),
+            "heavy_modules": runs[-1]["heavy_modules"],
+            "slowest": runs[-1]["slowest"],
+        }
+        print(
+            f"{target:12s} {statistics.median(totals) / 1e6:7.3f}s  "
+            f"{', '.join(runs[-1]['heavy_modules']) or '-'}",
+            file=sys.stderr,
+        )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,39 @@
-from .stl_exporter import STLExporter
+import os
+from .base_exporter import MeshExporter
+from .glb_exporter import GLBExporter
+from .ply_exporter import PLYExporter
+from .stl_exporter import STLExporter, STLStreamWriter, pack_stl_records
+from .threemf_exporter import ThreeMFExporter
 
-__all__ = ["STLExporter"]
+EXPORTERS = {
+    ".stl": STLExporter,
+    ".ply": PLYExporter,
+    ".glb": GLBExporter,
+    ".3mf": ThreeMFExporter,
+}
+
+
+def exporter_for(filename: str, **options) -> MeshExporter:
+    """
+    Exporter matching the extension of ``filename``, built with ``options``.
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in EXPORTERS:
+        raise ValueError(
+            f"Unsupported export format '{extension}', "
+            f"expected one of {sorted(EXPORTERS)}"
+        )
+    return EXPORTERS[extension](**options)
+
+
+__all__ = [
+    "EXPORTERS",
+    "GLBExporter",
+    "MeshExporter",
+    "PLYExporter",
+    "STLExporter",
+    "STLStreamWriter",
+    "ThreeMFExporter",
+    "exporter_for",
+    "pack_stl_records",
+]
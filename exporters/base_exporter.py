@@ -0,0 +1,30 @@
+import os
+from typing import List
+import numpy as np
+import trimesh
+from instrumentation import active_recorder, span
+
+
+class MeshExporter:
+    """
+    Base class for exporters that write one combined mesh per file.
+
+    Subclasses implement ``write``, which receives the vertex and face
+    arrays directly so that encoders can work on whole arrays at once.
+    """
+
+    def combine_meshes(self, meshes: List[trimesh.Trimesh]) -> trimesh.Trimesh:
+        if not meshes:
+            raise ValueError("No meshes to combine.")
+        with span("combine_meshes"):
+            return trimesh.util.concatenate(meshes)
+
+    def write(self, vertices: np.ndarray, faces: np.ndarray, filename: str) -> None:
+        raise NotImplementedError("Subclasses must implement write()")
+
+    def export(self, mesh: trimesh.Trimesh, filename: str) -> None:
+        with span("export"):
+            self.write(mesh.vertices, mesh.faces, filename)
+        recorder = active_recorder()
+        if recorder is not None:
+            recorder.count_written(len(mesh.faces), os.path.getsize(filename))
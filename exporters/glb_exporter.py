@@ -0,0 +1,134 @@
+import json
+import struct
+from typing import Optional
+import numpy as np
+from .base_exporter import MeshExporter
+from .quantization import index_dtype, quantize_positions
+
+GLB_MAGIC = 0x46546C67
+GLB_JSON_CHUNK = 0x4E4F534A
+GLB_BIN_CHUNK = 0x004E4942
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+COMPONENT_TYPES = {
+    np.dtype("u1"): 5121,
+    np.dtype("u2"): 5123,
+    np.dtype("u4"): 5125,
+    np.dtype("f4"): 5126,
+}
+
+
+def _pad(data: bytes, fill: bytes = b"\0") -> bytes:
+    return data + fill * (-len(data) % 4)
+
+
+class GLBExporter(MeshExporter):
+    """
+    Binary glTF 2.0 writer producing a single indexed triangle primitive.
+
+    ``position_bits`` stores positions as uint16 grid coordinates through
+    ``KHR_mesh_quantization``; the node's translation and scale map them
+    back to model units, so the error per coordinate is at most half a grid
+    step of the largest extent. ``compact_indices`` picks the narrowest
+    index component type that fits the vertex count.
+    """
+
+    def __init__(
+        self, position_bits: Optional[int] = None, compact_indices: bool = True
+    ) -> None:
+        self.position_bits = position_bits
+        self.compact_indices = compact_indices
+
+    def write(self, vertices: np.ndarray, faces: np.ndarray, filename: str) -> None:
+        vertices = np.asarray(vertices, dtype=np.float64)
+        faces = np.asarray(faces)
+        node = {"mesh": 0}
+        extensions = []
+        if self.position_bits is None:
+            positions = vertices.astype("<f4")
+            position_type = COMPONENT_TYPES[np.dtype("f4")]
+            stride = None
+            if len(positions):
+                bounds = [positions.min(axis=0), positions.max(axis=0)]
+            else:
+                bounds = [np.zeros(3), np.zeros(3)]
+        else:
+            quantized, offset, step = quantize_positions(vertices, self.position_bits)
+            # Vertex attributes must be 4-byte aligned: pad each uint16
+            # triple to 8 bytes.
+            positions = np.zeros((len(quantized), 4), dtype="<u2")
+            positions[:, :3] = quantized
+            position_type = COMPONENT_TYPES[np.dtype("u2")]
+            stride = positions.strides[0]
+            if len(quantized):
+                bounds = [quantized.min(axis=0), quantized.max(axis=0)]
+            else:
+                bounds = [np.zeros(3), np.zeros(3)]
+            node["translation"] = offset.tolist()
+            node["scale"] = [step] * 3
+            extensions = ["KHR_mesh_quantization"]
+        indices = faces.astype(
+            index_dtype(len(vertices), 1 if self.compact_indices else 4)
+        )
+        position_bytes = _pad(np.ascontiguousarray(positions).tobytes())
+        index_bytes = _pad(indices.tobytes())
+        position_view = {
+            "buffer": 0,
+            "byteOffset": 0,
+            "byteLength": len(position_bytes),
+            "target": ARRAY_BUFFER,
+        }
+        if stride is not None:
+            position_view["byteStride"] = stride
+        document = {
+            "asset": {"version": "2.0", "generator": "fabric6"},
+            "scene": 0,
+            "scenes": [{"nodes": [0]}],
+            "nodes": [node],
+            "meshes": [
+                {"primitives": [{"attributes": {"POSITION": 0}, "indices": 1}]}
+            ],
+            "accessors": [
+                {
+                    "bufferView": 0,
+                    "componentType": position_type,
+                    "count": len(vertices),
+                    "type": "VEC3",
+                    "min": [float(value) for value in bounds[0]],
+                    "max": [float(value) for value in bounds[1]],
+                },
+                {
+                    "bufferView": 1,
+                    "componentType": COMPONENT_TYPES[indices.dtype],
+                    "count": indices.size,
+                    "type": "SCALAR",
+                },
+            ],
+            "bufferViews": [
+                position_view,
+                {
+                    "buffer": 0,
+                    "byteOffset": len(position_bytes),
+                    "byteLength": indices.nbytes,
+                    "target": ELEMENT_ARRAY_BUFFER,
+                },
+            ],
+            "buffers": [{"byteLength": len(position_bytes) + len(index_bytes)}],
+        }
+        if extensions:
+            document["extensionsUsed"] = extensions
+            document["extensionsRequired"] = extensions
+        json_bytes = _pad(
+            json.dumps(document, separators=(",", ":")).encode("utf-8"), b" "
+        )
+        binary = position_bytes + index_bytes
+        with open(filename, "wb") as handle:
+            handle.write(
+                struct.pack(
+                    "<III", GLB_MAGIC, 2, 28 + len(json_bytes) + len(binary)
+                )
+            )
+            handle.write(struct.pack("<II", len(json_bytes), GLB_JSON_CHUNK))
+            handle.write(json_bytes)
+            handle.write(struct.pack("<II", len(binary), GLB_BIN_CHUNK))
+            handle.write(binary)
@@ -0,0 +1,44 @@
+import numpy as np
+from .base_exporter import MeshExporter
+from .quantization import index_dtype
+
+PLY_INDEX_TYPES = {1: "uchar", 2: "ushort", 4: "uint"}
+
+
+class PLYExporter(MeshExporter):
+    """
+    Binary little-endian PLY writer.
+
+    Vertices are stored once as float32 and faces as ``uchar``-counted
+    index lists; with ``compact_indices`` the index type is the narrowest
+    that fits the vertex count (``uchar``, ``ushort`` or ``uint``).
+    """
+
+    def __init__(self, compact_indices: bool = True) -> None:
+        self.compact_indices = compact_indices
+
+    def write(self, vertices: np.ndarray, faces: np.ndarray, filename: str) -> None:
+        vertices = np.asarray(vertices, dtype="<f4")
+        faces = np.asarray(faces)
+        indices = index_dtype(len(vertices), 1 if self.compact_indices else 4)
+        records = np.empty(
+            len(faces), dtype=[("count", "u1"), ("indices", indices, (3,))]
+        )
+        records["count"] = 3
+        records["indices"] = faces
+        header = (
+            "ply\n"
+            "format binary_little_endian 1.0\n"
+            "comment fabric6\n"
+            f"element vertex {len(vertices)}\n"
+            "property float x\n"
+            "property float y\n"
+            "property float z\n"
+            f"element face {len(faces)}\n"
+            f"property list uchar {PLY_INDEX_TYPES[indices.itemsize]} vertex_indices\n"
+            "end_header\n"
+        )
+        with open(filename, "wb") as handle:
+            handle.write(header.encode("ascii"))
+            handle.write(np.ascontiguousarray(vertices).tobytes())
+            handle.write(records.tobytes())
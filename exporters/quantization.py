@@ -0,0 +1,45 @@
+from typing import Tuple
+import numpy as np
+
+MAX_POSITION_BITS = 16
+
+
+def quantize_positions(
+    vertices: np.ndarray, bits: int = MAX_POSITION_BITS
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Snap ``vertices`` to a uniform grid of ``2**bits - 1`` steps spanning
+    their largest extent.
+
+    Returns ``(quantized, offset, step)`` with ``quantized`` as uint16, so
+    that ``offset + quantized * step`` recovers every coordinate to within
+    ``step / 2``.
+    """
+    if not 1 <= bits <= MAX_POSITION_BITS:
+        raise ValueError(f"Position bits must be between 1 and {MAX_POSITION_BITS}")
+    vertices = np.asarray(vertices, dtype=np.float64)
+    if len(vertices) == 0:
+        return np.zeros((0, 3), dtype=np.uint16), np.zeros(3), 1.0
+    offset = vertices.min(axis=0)
+    extent = float((vertices.max(axis=0) - offset).max())
+    step = extent / ((1 << bits) - 1) if extent > 0 else 1.0
+    quantized = np.rint((vertices - offset) / step).astype(np.uint16)
+    return quantized, offset, step
+
+
+def dequantize_positions(
+    quantized: np.ndarray, offset: np.ndarray, step: float
+) -> np.ndarray:
+    return np.asarray(offset, dtype=np.float64) + quantized * step
+
+
+def index_dtype(vertex_count: int, min_itemsize: int = 1) -> np.dtype:
+    """
+    Narrowest unsigned integer dtype (of at least ``min_itemsize`` bytes)
+    that can index ``vertex_count`` vertices.
+    """
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        dtype = np.dtype(dtype)
+        if dtype.itemsize >= min_itemsize and vertex_count <= np.iinfo(dtype).max + 1:
+            return dtype.newbyteorder("<")
+    raise ValueError(f"Too many vertices to index: {vertex_count}")
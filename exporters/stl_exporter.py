@@ -1,14 +1,127 @@
-from typing import List
+import os
+import struct
+from typing import BinaryIO, Iterable
+import numpy as np
 import trimesh
+from instrumentation import active_recorder, span
+from .base_exporter import MeshExporter
 
+STL_HEADER_SIZE = 80
+STL_RECORD_DTYPE = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attributes", "<u2")]
+)
 
-class STLExporter:
 
-    def combine_meshes(self, meshes: List[trimesh.Trimesh]) -> trimesh.Trimesh:
+def pack_stl_records(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """
+    Pack a mesh into binary STL triangle records with unit face normals.
+    """
+    triangles = np.asarray(vertices, dtype=np.float64)[np.asarray(faces)]
+    normals = np.cross(
+        triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+    )
+    lengths = np.linalg.norm(normals, axis=1)
+    np.divide(normals, lengths[:, None], out=normals, where=lengths[:, None] > 0)
+    normals[lengths == 0] = 0.0
+    records = np.zeros(len(triangles), dtype=STL_RECORD_DTYPE)
+    records["normal"] = normals
+    records["vertices"] = triangles
+    return records
 
-        if not meshes:
-            raise ValueError("No meshes to combine.")
-        return trimesh.util.concatenate(meshes)
+
+class STLStreamWriter:
+    """
+    Incremental binary STL writer.
+
+    The header and a placeholder triangle count are written on open, each
+    ``write`` appends packed triangle records, and ``close`` patches the
+    final count, so only one mesh's records are held in memory at a time.
+
+    Records go to a hidden ``.partial`` file next to ``filename``, which
+    ``close`` renames over it; ``abort`` (or leaving a ``with`` block by
+    an exception) deletes it, so a failed export never replaces a good
+    file with a truncated one.
+    """
+
+    def __init__(self, filename: str, header: bytes = b"fabric6 binary STL") -> None:
+        self.filename = filename
+        self.triangle_count = 0
+        directory, name = os.path.split(os.path.abspath(filename))
+        self._partial = os.path.join(directory, f".{name}.partial")
+        self._handle: BinaryIO = open(self._partial, "wb")
+        self._handle.write(header[:STL_HEADER_SIZE].ljust(STL_HEADER_SIZE, b"\0"))
+        self._handle.write(struct.pack("<I", 0))
+
+    def write(self, vertices: np.ndarray, faces: np.ndarray) -> None:
+        self.write_records(pack_stl_records(vertices, faces))
+
+    def write_records(self, records: np.ndarray) -> None:
+        """
+        Append already packed ``STL_RECORD_DTYPE`` records.
+        """
+        self._handle.write(records.tobytes())
+        self.triangle_count += len(records)
+
+    def write_mesh(self, mesh: trimesh.Trimesh) -> None:
+        self.write(mesh.vertices, mesh.faces)
+
+    def close(self) -> None:
+        if self._handle.closed:
+            return
+        try:
+            self._handle.seek(STL_HEADER_SIZE)
+            self._handle.write(struct.pack("<I", self.triangle_count))
+            self._handle.close()
+            os.replace(self._partial, self.filename)
+        except BaseException:
+            self.abort()
+            raise
+        recorder = active_recorder()
+        if recorder is not None:
+            recorder.count_written(
+                self.triangle_count,
+                STL_HEADER_SIZE + 4 + self.triangle_count * STL_RECORD_DTYPE.itemsize,
+            )
+
+    def abort(self) -> None:
+        """
+        Discard everything written and leave ``filename`` untouched.
+        """
+        self._handle.close()
+        if os.path.exists(self._partial):
+            os.remove(self._partial)
+
+    def __enter__(self) -> "STLStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class STLExporter(MeshExporter):
 
     def export(self, mesh: trimesh.Trimesh, filename: str) -> None:
-        mesh.export(filename, file_type="stl")
+        with span("export"):
+            mesh.export(filename, file_type="stl")
+        recorder = active_recorder()
+        if recorder is not None:
+            recorder.count_written(len(mesh.faces), os.path.getsize(filename))
+
+    def export_stream(self, meshes: Iterable[trimesh.Trimesh], filename: str) -> int:
+        """
+        Write ``meshes`` to a binary STL one at a time without combining them.
+
+        Returns the number of triangles written.
+        """
+        meshes = iter(meshes)
+        first = next(meshes, None)
+        if first is None:
+            raise ValueError("No meshes to combine.")
+        with span("export"), STLStreamWriter(filename) as writer:
+            writer.write_mesh(first)
+            for mesh in meshes:
+                writer.write_mesh(mesh)
+        return writer.triangle_count
@@ -0,0 +1,81 @@
+import zipfile
+from typing import Optional
+import numpy as np
+from .base_exporter import MeshExporter
+
+MODEL_PATH = "3D/3dmodel.model"
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="model" '
+    'ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>'
+    "</Types>"
+)
+RELATIONSHIPS = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Target="/{MODEL_PATH}" Id="rel0" '
+    'Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>'
+    "</Relationships>"
+)
+MODEL_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<model unit="millimeter" xml:lang="en-US" '
+    'xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">\n'
+    '<resources><object id="1" type="model"><mesh>\n'
+)
+MODEL_FOOTER = (
+    '</mesh></object></resources>\n<build><item objectid="1"/></build>\n</model>\n'
+)
+CHUNK_SIZE = 1 << 16
+
+
+class ThreeMFExporter(MeshExporter):
+    """
+    3MF (zipped XML) writer.
+
+    Elements are formatted a chunk at a time with one C-level ``%`` call
+    per chunk rather than per vertex. ``decimals`` rounds coordinates to a
+    fixed number of decimal places (error at most ``0.5 * 10**-decimals``),
+    which shortens the text; ``None`` keeps float32 precision. The model is
+    deflated at ``compresslevel``.
+    """
+
+    def __init__(self, decimals: Optional[int] = None, compresslevel: int = 6) -> None:
+        self.decimals = decimals
+        self.compresslevel = compresslevel
+
+    def write(self, vertices: np.ndarray, faces: np.ndarray, filename: str) -> None:
+        vertices = np.asarray(vertices, dtype=np.float64)
+        faces = np.asarray(faces)
+        number = "%.9g" if self.decimals is None else f"%.{self.decimals}f"
+        vertex_template = f'<vertex x="{number}" y="{number}" z="{number}"/>\n'
+        if self.decimals is not None:
+            vertices = np.round(vertices, self.decimals)
+        with zipfile.ZipFile(
+            filename,
+            "w",
+            compression=zipfile.ZIP_DEFLATED,
+            compresslevel=self.compresslevel,
+        ) as archive:
+            archive.writestr("[Content_Types].xml", CONTENT_TYPES)
+            archive.writestr("_rels/.rels", RELATIONSHIPS)
+            with archive.open(MODEL_PATH, "w", force_zip64=True) as handle:
+                handle.write(MODEL_HEADER.encode("utf-8"))
+                handle.write(b"<vertices>\n")
+                self._write_elements(handle, vertex_template, vertices)
+                handle.write(b"</vertices>\n<triangles>\n")
+                self._write_elements(
+                    handle, '<triangle v1="%d" v2="%d" v3="%d"/>\n', faces
+                )
+                handle.write(b"</triangles>\n")
+                handle.write(MODEL_FOOTER.encode("utf-8"))
+
+    @staticmethod
+    def _write_elements(handle, template: str, rows: np.ndarray) -> None:
+        for start in range(0, len(rows), CHUNK_SIZE):
+            chunk = rows[start : start + CHUNK_SIZE]
+            text = (template * len(chunk)) % tuple(chunk.ravel().tolist())
+            handle.write(text.encode("ascii"))
@@ -0,0 +1,156 @@
+"""
+Lightweight spans around the export pipeline stages.
+
+Pipeline code wraps its stages in ``span("stage", obj)``. Unless a
+``Recorder`` is active (see ``recording``) this returns a shared no-op
+context manager, so instrumentation costs one context-variable lookup per
+stage when disabled.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+SpanCallback = Callable[[str, float, Optional[Any]], None]
+
+_NULL_SPAN = nullcontext()
+_active: ContextVar[Optional["Recorder"]] = ContextVar(
+    "fabric6_recorder", default=None
+)
+
+
+class StageStats:
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self.calls = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"seconds": self.seconds, "calls": self.calls}
+
+
+class ObjectStats:
+    def __init__(self, index: int, name: str) -> None:
+        self.index = index
+        self.name = name
+        self.stages: Dict[str, float] = {}
+        self.triangles = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "name": self.name,
+            "stages": dict(self.stages),
+            "triangles": self.triangles,
+        }
+
+
+class ExportStats:
+    """
+    Per-stage and per-object timings gathered during one export.
+
+    Stage times are wall times and nest: ``get_mesh`` includes ``build`` and
+    ``tessellate``, and a streaming ``export`` includes the meshing it drives.
+    Work done in worker processes is only visible as the parent's stages.
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, StageStats] = {}
+        self.objects: Dict[int, ObjectStats] = {}
+        self.triangles = 0
+        self.bytes_written = 0
+        self.vertices_merged = 0
+        self.peak_bytes: Optional[int] = None
+
+    def object_stats(self, obj: Any) -> ObjectStats:
+        stats = self.objects.get(id(obj))
+        if stats is None:
+            stats = ObjectStats(len(self.objects), type(obj).__name__)
+            self.objects[id(obj)] = stats
+        return stats
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "stages": {name: s.as_dict() for name, s in self.stages.items()},
+            "objects": [s.as_dict() for s in self.objects.values()],
+            "triangles": self.triangles,
+            "bytes_written": self.bytes_written,
+            "vertices_merged": self.vertices_merged,
+            "peak_bytes": self.peak_bytes,
+        }
+
+
+class Recorder:
+    """
+    Collects spans into an ``ExportStats`` and forwards them to callbacks.
+
+    Callbacks are called as ``callback(stage, seconds, obj)`` when each span
+    ends. With ``trace_memory`` the peak traced allocation is recorded via
+    ``tracemalloc``, which slows allocation-heavy code noticeably.
+    """
+
+    def __init__(
+        self, callbacks: Optional[List[SpanCallback]] = None, trace_memory: bool = False
+    ) -> None:
+        self.callbacks = list(callbacks or [])
+        self.trace_memory = trace_memory
+        self.stats = ExportStats()
+
+    def add_callback(self, callback: SpanCallback) -> None:
+        self.callbacks.append(callback)
+
+    @contextmanager
+    def span(self, stage: str, obj: Any = None) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stage_stats = self.stats.stages.setdefault(stage, StageStats())
+            stage_stats.seconds += elapsed
+            stage_stats.calls += 1
+            if obj is not None:
+                object_stages = self.stats.object_stats(obj).stages
+                object_stages[stage] = object_stages.get(stage, 0.0) + elapsed
+            for callback in self.callbacks:
+                callback(stage, elapsed, obj)
+
+    def count_object_triangles(self, obj: Any, count: int) -> None:
+        self.stats.object_stats(obj).triangles += count
+
+    def count_written(self, triangles: int, nbytes: int) -> None:
+        self.stats.triangles += triangles
+        self.stats.bytes_written += nbytes
+
+    def count_welded(self, merged: int) -> None:
+        self.stats.vertices_merged += merged
+
+
+def active_recorder() -> Optional[Recorder]:
+    return _active.get()
+
+
+def span(stage: str, obj: Any = None):
+    recorder = _active.get()
+    if recorder is None:
+        return _NULL_SPAN
+    return recorder.span(stage, obj)
+
+
+@contextmanager
+def recording(recorder: Recorder) -> Iterator[Recorder]:
+    """
+    Make ``recorder`` the active recorder for the enclosed block.
+    """
+    token = _active.set(recorder)
+    tracing = recorder.trace_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    try:
+        yield recorder
+    finally:
+        if tracing:
+            recorder.stats.peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        _active.reset(token)
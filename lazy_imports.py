@@ -0,0 +1,28 @@
+"""
+Deferred attribute imports for package ``__init__`` modules.
+
+Heavy dependencies (trimesh, CadQuery/OCC) are only loaded when the names
+that need them are first used, so ``import objects`` and friends stay
+cheap.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict
+
+
+def lazy_attributes(package: str, names: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Return a module ``__getattr__`` for ``package`` that imports each
+    ``name`` from the module ``names[name]`` (relative to ``package``) on
+    first access and caches it in the package namespace.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in names:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(names[name], package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -0,0 +1,13 @@
+from lazy_imports import lazy_attributes
+
+from .cache import TessellationCache, get_default_cache, set_default_cache
+
+# Imported on first use: tessellation pulls in OCP.
+__getattr__ = lazy_attributes(__name__, {"tessellate_shape": ".tessellation"})
+
+__all__ = [
+    "TessellationCache",
+    "get_default_cache",
+    "set_default_cache",
+    "tessellate_shape",
+]
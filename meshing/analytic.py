@@ -0,0 +1,160 @@
+"""
+Closed-form NumPy mesh generators for the built-in primitives.
+
+Each generator reproduces the placement of the matching CadQuery primitive
+(centred boxes, spheres and cylinders; pyramids standing on the XY plane)
+and picks its segment count so that the chordal deviation from the true
+surface stays within ``tolerance`` and no segment spans more than
+``angular_tolerance`` radians.
+"""
+
+import math
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+MeshArrays = Tuple[np.ndarray, np.ndarray]
+
+
+def segment_count(
+    radius: float, tolerance: float, angular_tolerance: float = 0.1
+) -> int:
+    """
+    Number of segments needed to approximate a circle of ``radius``.
+    """
+    count = 3
+    if angular_tolerance > 0:
+        count = max(count, math.ceil(2 * math.pi / angular_tolerance))
+    if 0 < tolerance < radius:
+        count = max(count, math.ceil(math.pi / math.acos(1 - tolerance / radius)))
+    return count
+
+
+def sphere_segment_count(
+    radius: float, tolerance: float, angular_tolerance: float = 0.1
+) -> int:
+    """
+    Segments per ring of a UV sphere of ``radius``.
+
+    A triangle spans the diagonal of its latitude/longitude cell, and the
+    sagitta grows with the square of the span, so the segments are sized
+    for half the tolerance (with rings no further apart than segments) to
+    keep the triangle interiors within it.
+    """
+    return segment_count(radius, tolerance / 2, angular_tolerance)
+
+
+def _ring_faces(first: int, second: int, segments: int) -> np.ndarray:
+    """
+    Quads between two rings of ``segments`` vertices, split into triangles.
+    """
+    i = np.arange(segments)
+    j = (i + 1) % segments
+    a, b = first + i, first + j
+    c, d = second + i, second + j
+    return np.concatenate(
+        [np.stack([a, b, d], axis=1), np.stack([a, d, c], axis=1)]
+    )
+
+
+def _fan_faces(center: int, ring: int, segments: int, flip: bool) -> np.ndarray:
+    i = np.arange(segments)
+    j = (i + 1) % segments
+    centers = np.full(segments, center)
+    if flip:
+        return np.stack([centers, ring + j, ring + i], axis=1)
+    return np.stack([centers, ring + i, ring + j], axis=1)
+
+
+def box_mesh(length: float, width: float, height: float) -> MeshArrays:
+    half = np.array([length, width, height], dtype=np.float64) / 2
+    corners = np.array(
+        [[x, y, z] for z in (-1, 1) for y in (-1, 1) for x in (-1, 1)],
+        dtype=np.float64,
+    )
+    faces = np.array(
+        [
+            [0, 2, 1], [1, 2, 3],
+            [4, 5, 6], [5, 7, 6],
+            [0, 1, 4], [1, 5, 4],
+            [2, 6, 3], [3, 6, 7],
+            [0, 4, 2], [2, 4, 6],
+            [1, 3, 5], [3, 7, 5],
+        ],
+        dtype=np.int32,
+    )
+    return corners * half, faces
+
+
+@lru_cache(maxsize=64)
+def _unit_sphere(segments: int) -> MeshArrays:
+    rings = max(2, (segments + 1) // 2)
+    theta = np.linspace(0, np.pi, rings + 1)[1:-1]
+    phi = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    sin_t, cos_t = np.sin(theta)[:, None], np.cos(theta)[:, None]
+    body = np.stack(
+        [
+            sin_t * np.cos(phi),
+            sin_t * np.sin(phi),
+            np.broadcast_to(cos_t, (len(theta), segments)),
+        ],
+        axis=-1,
+    ).reshape(-1, 3)
+    vertices = np.concatenate([[[0, 0, 1]], body, [[0, 0, -1]]])
+
+    south = len(vertices) - 1
+    faces = [_fan_faces(0, 1, segments, flip=False)]
+    starts = 1 + segments * np.arange(len(theta) - 1)
+    faces.extend(_ring_faces(s + segments, s, segments) for s in starts)
+    faces.append(_fan_faces(south, 1 + segments * (len(theta) - 1), segments, True))
+    vertices.flags.writeable = False
+    faces = np.concatenate(faces).astype(np.int32)
+    faces.flags.writeable = False
+    return vertices, faces
+
+
+def sphere_mesh(
+    radius: float, tolerance: float = 0.1, angular_tolerance: float = 0.1
+) -> MeshArrays:
+    vertices, faces = _unit_sphere(
+        sphere_segment_count(radius, tolerance, angular_tolerance)
+    )
+    return vertices * radius, faces.copy()
+
+
+def cylinder_mesh(
+    height: float,
+    radius: float,
+    tolerance: float = 0.1,
+    angular_tolerance: float = 0.1,
+) -> MeshArrays:
+    segments = segment_count(radius, tolerance, angular_tolerance)
+    phi = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    circle = np.stack([np.cos(phi), np.sin(phi)], axis=1) * radius
+    half = height / 2
+    bottom = np.column_stack([circle, np.full(segments, -half)])
+    top = np.column_stack([circle, np.full(segments, half)])
+    vertices = np.concatenate([bottom, top, [[0, 0, -half], [0, 0, half]]])
+    faces = np.concatenate(
+        [
+            _ring_faces(0, segments, segments),
+            _fan_faces(2 * segments, 0, segments, flip=True),
+            _fan_faces(2 * segments + 1, segments, segments, flip=False),
+        ]
+    )
+    return vertices, faces.astype(np.int32)
+
+
+def pyramid_mesh(base: float, height: float, apex: float = 0.001) -> MeshArrays:
+    square = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]], dtype=np.float64) / 2
+    bottom = np.column_stack([square * base, np.zeros(4)])
+    top = np.column_stack([square * apex, np.full(4, float(height))])
+    vertices = np.concatenate([bottom, top])
+    faces = np.concatenate(
+        [
+            _ring_faces(0, 4, 4),
+            np.array([[0, 2, 1], [0, 3, 2], [4, 5, 6], [4, 6, 7]]),
+        ]
+    )
+    return vertices, faces.astype(np.int32)
@@ -0,0 +1,83 @@
+"""
+Boolean union of placed CadQuery solids by balanced pairwise reduction.
+
+Shapes are fused in rounds: each round fuses disjoint pairs, which are
+independent and can run in separate processes, so ``n`` parts need
+``ceil(log2(n))`` rounds instead of a serial chain of ``n - 1`` fuses.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+import cadquery as cq
+import numpy as np
+from OCP.BRepBuilderAPI import BRepBuilderAPI_GTransform, BRepBuilderAPI_Transform
+from OCP.gp import gp_GTrsf, gp_Mat, gp_Trsf, gp_XYZ
+
+from .transforms import is_identity
+
+
+def transform_shape(shape: cq.Shape, matrix: np.ndarray) -> cq.Shape:
+    """
+    Apply a 4x4 affine transform to a CadQuery shape.
+
+    Rigid motions and uniform scales move the shape; other linear parts
+    fall back to a general (geometry-rewriting) transform.
+    """
+    if is_identity(matrix):
+        return shape
+    linear = matrix[:3, :3]
+    scales = np.linalg.norm(linear, axis=0)
+    if np.allclose(scales, scales[0]) and np.allclose(
+        linear.T @ linear, np.eye(3) * scales[0] ** 2
+    ):
+        trsf = gp_Trsf()
+        trsf.SetValues(*(float(v) for v in matrix[:3].ravel()))
+        builder = BRepBuilderAPI_Transform(shape.wrapped, trsf, True)
+    else:
+        gtrsf = gp_GTrsf(
+            gp_Mat(*(float(v) for v in linear.ravel())),
+            gp_XYZ(*(float(v) for v in matrix[:3, 3])),
+        )
+        builder = BRepBuilderAPI_GTransform(shape.wrapped, gtrsf, True)
+    return cq.Shape.cast(builder.Shape())
+
+
+def _fuse_pair(pair: Tuple[cq.Shape, cq.Shape]) -> cq.Shape:
+    first, second = pair
+    return first.fuse(second).clean()
+
+
+def fuse_shapes(
+    shapes: Sequence[cq.Shape],
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+) -> cq.Shape:
+    """
+    Union ``shapes`` into a single shape with a balanced pairwise reduction.
+
+    With ``parallel`` every round's pairs are fused in a process pool that is
+    reused across rounds; shapes cross the process boundary as serialized
+    B-reps.
+    """
+    level: List[cq.Shape] = list(shapes)
+    if not level:
+        raise ValueError("No shapes to fuse.")
+    pool = None
+    if parallel and len(level) > 2:
+        workers = max_workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(level) // 2))
+    try:
+        while len(level) > 1:
+            pairs = list(zip(level[0::2], level[1::2]))
+            carry = [level[-1]] if len(level) % 2 else []
+            if pool is not None and len(pairs) > 1:
+                fused = list(pool.map(_fuse_pair, pairs))
+            else:
+                fused = [_fuse_pair(pair) for pair in pairs]
+            level = fused + carry
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return level[0]
@@ -0,0 +1,255 @@
+"""
+Content-addressed cache for tessellated vertex/face arrays.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from numbers import Real
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "fabric6", "tessellation"
+)
+
+MeshArrays = Tuple[np.ndarray, np.ndarray]
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, Real):
+        return float(value)
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return [_normalize(v) for v in value.tolist()]
+    return repr(value)
+
+
+class TessellationCache:
+    """
+    Two-tier (memory LRU + on-disk) cache of tessellation results.
+
+    Entries are keyed by a digest of (shape kind, normalized parameters,
+    tolerance, transform). The memory tier holds at most ``max_entries``
+    results; the disk tier stores one ``.npz`` file per entry and evicts the
+    least recently used files once ``max_disk_bytes`` is exceeded. Pass
+    ``cache_dir=None`` for a memory-only cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries must be non-negative")
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, MeshArrays]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Running size of the disk tier, seeded by the first scan.
+        self._disk_bytes: Optional[int] = None
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_memory"] = OrderedDict()
+        state["_disk_bytes"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        kind: str,
+        parameters: Dict[str, Any],
+        tolerance: Any,
+        transform: Any = None,
+    ) -> str:
+        payload = json.dumps(
+            [
+                CACHE_VERSION,
+                kind,
+                _normalize(parameters),
+                _normalize(tolerance),
+                _normalize(transform),
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def _remember(self, key: str, arrays: MeshArrays) -> None:
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            self._memory[key] = arrays
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[MeshArrays]:
+        """
+        Return copies of the cached (vertices, faces) arrays, or None.
+        """
+        with self._lock:
+            arrays = self._memory.get(key)
+            if arrays is not None:
+                self._memory.move_to_end(key)
+        if arrays is None and self.cache_dir is not None:
+            arrays = self._load(key)
+            if arrays is not None:
+                self._remember(key, arrays)
+        if arrays is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return arrays[0].copy(), arrays[1].copy()
+
+    def put(self, key: str, vertices: np.ndarray, faces: np.ndarray) -> None:
+        vertices = np.array(vertices, dtype=np.float64)
+        faces = np.array(faces, dtype=np.int32)
+        vertices.flags.writeable = False
+        faces.flags.writeable = False
+        self._remember(key, (vertices, faces))
+        if self.cache_dir is not None:
+            self._store(key, vertices, faces)
+
+    def get_or_compute(
+        self, key: str, compute: Callable[[], MeshArrays]
+    ) -> MeshArrays:
+        arrays = self.get(key)
+        if arrays is not None:
+            return arrays
+        vertices, faces = compute()
+        self.put(key, vertices, faces)
+        return vertices, faces
+
+    def clear(self, disk: bool = False) -> None:
+        with self._lock:
+            self._memory.clear()
+        if disk and self.cache_dir is not None:
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".npz"):
+                    self._unlink(entry.path)
+            with self._lock:
+                self._disk_bytes = 0
+
+    def _load(self, key: str) -> Optional[MeshArrays]:
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                vertices, faces = data["vertices"], data["faces"]
+            os.utime(path)
+        except (OSError, KeyError, ValueError):
+            return None
+        vertices.flags.writeable = False
+        faces.flags.writeable = False
+        return vertices, faces
+
+    def _store(self, key: str, vertices: np.ndarray, faces: np.ndarray) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as handle:
+                np.savez(handle, vertices=vertices, faces=faces)
+            size = os.path.getsize(tmp_path)
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, path)
+        except OSError:
+            self._unlink(tmp_path)
+            return
+        with self._lock:
+            if self._disk_bytes is None:
+                scan = True
+            else:
+                self._disk_bytes += size - replaced
+                scan = self._disk_bytes > self.max_disk_bytes
+        if scan:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """
+        Rescan the disk tier, delete the least recently used entries until
+        it fits ``max_disk_bytes`` and reset the running size.
+
+        Only runs when the running size (or the first store) says it may be
+        needed, so storing N entries does not rescan the directory N times.
+        The rescan also corrects the total for entries written by other
+        processes sharing the directory.
+        """
+        entries = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(".npz"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+        if total > self.max_disk_bytes:
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_disk_bytes:
+                    break
+                self._unlink(path)
+                total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+    @staticmethod
+    def _unlink(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+_default_cache: Optional[TessellationCache] = None
+
+
+def get_default_cache() -> TessellationCache:
+    """
+    Return the process-wide cache, creating it on first use.
+
+    The disk tier lives in ``$FABRIC6_CACHE_DIR`` (default
+    ``~/.cache/fabric6/tessellation``); set the variable to an empty string
+    to keep the cache in memory only.
+    """
+    global _default_cache
+    if _default_cache is None:
+        cache_dir = os.environ.get("FABRIC6_CACHE_DIR", DEFAULT_CACHE_DIR) or None
+        try:
+            _default_cache = TessellationCache(cache_dir=cache_dir)
+        except OSError:
+            _default_cache = TessellationCache(cache_dir=None)
+    return _default_cache
+
+
+def set_default_cache(cache: Optional[TessellationCache]) -> None:
+    global _default_cache
+    _default_cache = cache
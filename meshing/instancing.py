@@ -0,0 +1,60 @@
+"""
+Grouping of scene objects that share identical geometry.
+"""
+
+from typing import Dict, Hashable, List, Sequence, Tuple
+
+import numpy as np
+
+from .transforms import apply_transforms
+
+
+class InstanceGroup:
+    """
+    Objects that share one mesh and differ only by their transforms.
+    """
+
+    def __init__(self, key: Hashable) -> None:
+        self.key = key
+        self.objects: List = []
+
+    @property
+    def representative(self):
+        return self.objects[0]
+
+    def transforms(self) -> np.ndarray:
+        return np.stack([obj.transform for obj in self.objects])
+
+
+def group_instances(objects: Sequence) -> Tuple[List[InstanceGroup], List]:
+    """
+    Split ``objects`` into instance groups and objects that cannot be shared.
+
+    Objects are grouped by ``geometry_key()``; objects whose key is None are
+    returned separately. Groups keep the order of their first member.
+    """
+    groups: Dict[Hashable, InstanceGroup] = {}
+    unique = []
+    for obj in objects:
+        key = obj.geometry_key()
+        if key is None:
+            unique.append(obj)
+            continue
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = InstanceGroup(key)
+        group.objects.append(obj)
+    return list(groups.values()), unique
+
+
+def expand_instances(
+    vertices: np.ndarray, faces: np.ndarray, transforms: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expand one shared mesh into ``len(transforms)`` placed copies.
+    """
+    count = len(transforms)
+    placed = apply_transforms(vertices, transforms).reshape(-1, 3)
+    offsets = (np.arange(count) * len(vertices))[:, None, None]
+    placed_faces = (faces[None, :, :] + offsets).reshape(-1, 3)
+    return placed, placed_faces
@@ -0,0 +1,136 @@
+"""
+Process-pool meshing of scene objects.
+
+OCC tessellation holds the GIL, so objects are built and meshed in worker
+processes. Results come back through ``multiprocessing.shared_memory``
+blocks rather than as pickled meshes; only the block names and array
+shapes cross the process boundary.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from itertools import islice
+from multiprocessing import resource_tracker, shared_memory
+from typing import Deque, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import trimesh
+
+SharedArray = Tuple[str, Tuple[int, ...], str]
+
+IN_FLIGHT_PER_WORKER = 2
+
+
+def _share(array: np.ndarray) -> SharedArray:
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    try:
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    finally:
+        block.close()
+    # Ownership passes to the parent, which registers the block again when it
+    # attaches and unlinks it after copying the data out.
+    resource_tracker.unregister(block._name, "shared_memory")
+    return block.name, array.shape, array.dtype.str
+
+
+def _take(shared: SharedArray) -> np.ndarray:
+    name, shape, dtype = shared
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return np.ndarray(shape, dtype=dtype, buffer=block.buf).copy()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _discard(shared: SharedArray) -> None:
+    try:
+        block = shared_memory.SharedMemory(name=shared[0])
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
+
+def _discard_result(future: Future) -> None:
+    """
+    Unlink the blocks of a finished result that will never be taken.
+    """
+    if future.cancelled() or future.exception() is not None:
+        return
+    for shared in future.result():
+        _discard(shared)
+
+
+def _mesh_worker(obj, local: bool = False) -> Tuple[SharedArray, SharedArray]:
+    if local:
+        vertices, faces = obj.mesh_arrays()
+    else:
+        mesh = obj.get_mesh()
+        vertices, faces = mesh.vertices, mesh.faces
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int32)
+    shared_vertices = _share(vertices)
+    try:
+        return shared_vertices, _share(faces)
+    except BaseException:
+        _discard(shared_vertices)
+        raise
+
+
+def iter_meshes_parallel(
+    objects: Sequence, max_workers: Optional[int] = None, local: bool = False
+) -> Iterator[trimesh.Trimesh]:
+    """
+    Build and mesh ``objects`` across a process pool, yielding in order.
+
+    With ``local=True`` the untransformed ``mesh_arrays()`` of each object
+    are returned instead of ``get_mesh()``. The objects are pickled into the
+    workers, so models built there are not written back to the caller's
+    objects.
+
+    At most ``IN_FLIGHT_PER_WORKER`` objects per worker are queued or
+    waiting in shared memory at a time, so a slow consumer (e.g. a
+    streaming writer) holds a bounded number of meshes, not the scene.
+    """
+    if not objects:
+        return
+    workers = max_workers or os.cpu_count() or 1
+    workers = min(workers, len(objects))
+    window = IN_FLIGHT_PER_WORKER * workers
+    queued = iter(objects)
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            while True:
+                for obj in islice(queued, window - len(pending)):
+                    pending.append(pool.submit(_mesh_worker, obj, local))
+                if not pending:
+                    break
+                shared_vertices, shared_faces = pending.popleft().result()
+                try:
+                    vertices = _take(shared_vertices)
+                finally:
+                    faces = _take(shared_faces)
+                yield trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+        finally:
+            # On failure or early exit, results already in shared memory are
+            # owned by nobody else; wait for them and unlink their blocks.
+            for future in pending:
+                future.cancel()
+            wait(pending)
+            for future in pending:
+                _discard_result(future)
+
+
+def mesh_objects_parallel(
+    objects: Sequence, max_workers: Optional[int] = None
+) -> List[trimesh.Trimesh]:
+    """
+    Build and mesh ``objects`` across a process pool.
+
+    Meshes are returned in the same order as ``objects``.
+    """
+    return list(iter_meshes_parallel(objects, max_workers))
@@ -0,0 +1,75 @@
+"""
+Bulk extraction of OCC face triangulations into NumPy arrays.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from OCP.BRep import BRep_Tool
+from OCP.BRepTools import BRepTools
+from OCP.gp import gp_Pnt
+from OCP.Poly import Poly_Triangle
+from OCP.TopAbs import TopAbs_FACE, TopAbs_REVERSED
+from OCP.TopExp import TopExp
+from OCP.TopLoc import TopLoc_Location
+from OCP.TopoDS import TopoDS
+from OCP.TopTools import TopTools_IndexedMapOfShape
+
+
+def tessellate_shape(
+    shape, tolerance: float, angular_tolerance: float = 0.1
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mesh a CadQuery shape and return ``(vertices, faces)`` arrays.
+
+    Vertices are a contiguous ``(n, 3)`` float64 array and faces a ``(m, 3)``
+    int32 array, with the same ordering and winding as
+    ``cadquery.Shape.tessellate``. Node coordinates are read once per face
+    and face locations, index offsets and reversed windings are applied to
+    whole blocks instead of per vertex.
+    """
+    if hasattr(shape, "val"):
+        shape = shape.val()
+    # OCC keeps an existing triangulation that is finer than requested, so
+    # a model meshed at a higher quality would never get coarser again.
+    BRepTools.Clean_s(shape.wrapped)
+    shape.mesh(tolerance, angular_tolerance)
+
+    face_map = TopTools_IndexedMapOfShape()
+    TopExp.MapShapes_s(shape.wrapped, TopAbs_FACE, face_map)
+
+    vertex_blocks = []
+    face_blocks = []
+    offset = 0
+    for index in range(1, face_map.Extent() + 1):
+        face = TopoDS.Face_s(face_map.FindKey(index))
+        location = TopLoc_Location()
+        poly = BRep_Tool.Triangulation_s(face, location)
+        if poly is None:
+            continue
+        node_count = poly.NbNodes()
+        nodes = np.array(
+            list(map(gp_Pnt.Coord, map(poly.Node, range(1, node_count + 1)))),
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        if not location.IsIdentity():
+            trsf = location.Transformation()
+            matrix = np.array(
+                [[trsf.Value(r, c) for c in range(1, 5)] for r in range(1, 4)]
+            )
+            nodes = nodes @ matrix[:, :3].T + matrix[:, 3]
+        triangles = np.array(
+            list(map(Poly_Triangle.Get, poly.Triangles())), dtype=np.int32
+        ).reshape(-1, 3)
+        triangles += offset - 1
+        if face.Orientation() == TopAbs_REVERSED:
+            triangles = triangles[:, [0, 2, 1]]
+        vertex_blocks.append(nodes)
+        face_blocks.append(triangles)
+        offset += node_count
+
+    if not vertex_blocks:
+        return np.zeros((0, 3), dtype=np.float64), np.zeros((0, 3), dtype=np.int32)
+    vertices = np.ascontiguousarray(np.concatenate(vertex_blocks))
+    faces = np.ascontiguousarray(np.concatenate(face_blocks))
+    return vertices, faces
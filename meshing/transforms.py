@@ -0,0 +1,79 @@
+"""
+Helpers for 4x4 affine transforms applied to vertex arrays.
+"""
+
+import numpy as np
+
+IDENTITY = np.eye(4)
+IDENTITY.flags.writeable = False
+
+
+def is_identity(matrix: np.ndarray) -> bool:
+    return matrix is IDENTITY or np.array_equal(matrix, IDENTITY)
+
+
+def apply_transform(vertices: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """
+    Return ``vertices`` transformed by the affine ``matrix``.
+    """
+    if is_identity(matrix):
+        return vertices
+    return vertices @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def apply_transforms(vertices: np.ndarray, matrices: np.ndarray) -> np.ndarray:
+    """
+    Transform one vertex array by a stack of ``k`` matrices at once.
+
+    Returns a ``(k, n, 3)`` array.
+    """
+    return (
+        np.einsum("kij,nj->kni", matrices[:, :3, :3], vertices)
+        + matrices[:, None, :3, 3]
+    )
+
+
+def translation_matrix(offset) -> np.ndarray:
+    matrix = np.eye(4)
+    matrix[:3, 3] = offset
+    return matrix
+
+
+def rotation_matrix(axis, angle: float, center=(0.0, 0.0, 0.0)) -> np.ndarray:
+    """
+    Rotation by ``angle`` degrees about ``axis`` through ``center``.
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    norm = np.linalg.norm(axis)
+    if norm == 0:
+        raise ValueError("Rotation axis must be non-zero")
+    x, y, z = axis / norm
+    theta = np.radians(angle)
+    cos, sin = np.cos(theta), np.sin(theta)
+    cross = np.array([[0, -z, y], [z, 0, -x], [-y, x, 0]])
+    matrix = np.eye(4)
+    matrix[:3, :3] = cos * np.eye(3) + sin * cross + (1 - cos) * np.outer(
+        (x, y, z), (x, y, z)
+    )
+    return _about(matrix, center)
+
+
+def scale_matrix(factor, center=(0.0, 0.0, 0.0)) -> np.ndarray:
+    """
+    Uniform (scalar) or per-axis scale about ``center``.
+
+    Factors must be positive so the transform never flips face winding.
+    """
+    factors = np.broadcast_to(np.asarray(factor, dtype=np.float64), (3,))
+    if np.any(factors <= 0):
+        raise ValueError("Scale factors must be positive")
+    matrix = np.eye(4)
+    matrix[:3, :3] = np.diag(factors)
+    return _about(matrix, center)
+
+
+def _about(matrix: np.ndarray, center) -> np.ndarray:
+    center = np.asarray(center, dtype=np.float64)
+    if not center.any():
+        return matrix
+    return translation_matrix(center) @ matrix @ translation_matrix(-center)
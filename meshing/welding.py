@@ -0,0 +1,74 @@
+"""
+Merging of coincident mesh vertices.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+DEFAULT_WELD_TOLERANCE = 1e-6
+PACKED_AXIS_BITS = 21
+
+
+def weld_vertices(
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    tolerance: float = DEFAULT_WELD_TOLERANCE,
+    drop_degenerate: bool = True,
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Merge vertices that round to the same point of a ``tolerance`` grid.
+
+    Coordinates are quantized to int64 grid cells and deduplicated with one
+    sort over the cells (packed into a single integer key when they fit),
+    so the cost is O(n log n) with no pairwise search. Vertices closer than
+    ``tolerance`` that straddle a cell boundary are not merged. The first
+    vertex of each cell is kept and vertex order is preserved. Faces that
+    collapse onto a repeated vertex are dropped unless ``drop_degenerate``
+    is False.
+
+    Returns ``(vertices, faces, merged)`` where ``merged`` is the number
+    of vertices removed.
+    """
+    if tolerance <= 0:
+        raise ValueError("Weld tolerance must be positive")
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.asarray(faces)
+    if len(vertices) == 0:
+        return vertices, faces, 0
+    cells = np.rint(vertices / tolerance).astype(np.int64)
+    cells -= cells.min(axis=0)
+    if cells.max() < 1 << PACKED_AXIS_BITS:
+        # Pack the three cell coordinates into one int64 key: sorting a
+        # flat integer array is several times cheaper than a lexsort.
+        keys = (
+            cells[:, 0] << (2 * PACKED_AXIS_BITS)
+            | cells[:, 1] << PACKED_AXIS_BITS
+            | cells[:, 2]
+        )
+        order = np.argsort(keys)
+        keys = keys[order]
+        changed = keys[1:] != keys[:-1]
+    else:
+        order = np.lexsort(cells.T[::-1])
+        cells = cells[order]
+        changed = (cells[1:] != cells[:-1]).any(axis=1)
+    starts = np.flatnonzero(np.r_[True, changed])
+    merged = len(vertices) - len(starts)
+    if merged == 0:
+        return vertices, faces, 0
+    # Keep the earliest vertex of each cell and number the cells in the
+    # order of those vertices, so unmerged meshes keep their layout.
+    first = np.minimum.reduceat(order, starts)
+    rank = np.empty_like(first)
+    rank[np.argsort(first)] = np.arange(len(first))
+    remap = np.empty_like(order)
+    remap[order] = np.repeat(rank, np.diff(np.r_[starts, len(order)]))
+    faces = remap[faces]
+    if drop_degenerate and len(faces):
+        faces = faces[
+            (faces[:, 0] != faces[:, 1])
+            & (faces[:, 1] != faces[:, 2])
+            & (faces[:, 0] != faces[:, 2])
+        ]
+    return vertices[np.sort(first)], faces, merged
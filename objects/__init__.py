@@ -1,5 +1,9 @@
+from lazy_imports import lazy_attributes
+
 from .base_object import BaseObject
 from .organic_object import OrganicObject
-from .precision_object import PrecisionObject
+
+# PrecisionObject loads CadQuery/OCC, which organic-only code never needs.
+__getattr__ = lazy_attributes(__name__, {"PrecisionObject": ".precision_object"})
 
 __all__ = ["BaseObject", "OrganicObject", "PrecisionObject"]
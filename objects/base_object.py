@@ -2,7 +2,11 @@
 Abstract base class for 3D objects in the scene.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Hashable, Optional
+
+import numpy as np
+
+from meshing.transforms import rotation_matrix, scale_matrix, translation_matrix
 
 
 class BaseObject:
@@ -10,13 +14,93 @@ class BaseObject:
     def __init__(self, parameters: Dict[str, Any] = None) -> None:
 
         self.parameters = parameters if parameters is not None else {}
+        self.transform = np.eye(4)
+        self.version = 0
 
     def build(self) -> None:
         raise NotImplementedError("Subclasses must implement build()")
 
+    def apply_transform(self, matrix: np.ndarray) -> "BaseObject":
+        """
+        Compose ``matrix`` after the current placement.
+
+        Transforms are only accumulated here and applied to the tessellated
+        vertices in ``get_mesh``, so moving an object never rebuilds or
+        re-tessellates it. Like ``scale_matrix``, reflections and singular
+        matrices are rejected: they would flip or collapse the face winding
+        of the exported mesh.
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.shape != (4, 4):
+            raise ValueError(f"Transform must be a 4x4 matrix, got {matrix.shape}")
+        if np.linalg.det(matrix[:3, :3]) <= 0:
+            raise ValueError("Transform must preserve orientation (determinant > 0)")
+        self.transform = matrix @ self.transform
+        return self
+
+    def translate(self, offset) -> "BaseObject":
+        return self.apply_transform(translation_matrix(offset))
+
+    def rotate(self, axis, angle: float, center=(0.0, 0.0, 0.0)) -> "BaseObject":
+        return self.apply_transform(rotation_matrix(axis, angle, center))
+
+    def scale(self, factor, center=(0.0, 0.0, 0.0)) -> "BaseObject":
+        return self.apply_transform(scale_matrix(factor, center))
+
+    def reset_transform(self) -> "BaseObject":
+        self.transform = np.eye(4)
+        return self
+
+    def mark_dirty(self) -> None:
+        """
+        Record that the object's geometry changed in a way ``state_token``
+        cannot see, e.g. a rebuild with new random noise.
+        """
+        self.version += 1
+
+    def state_token(self) -> Hashable:
+        """
+        Value that changes whenever the object's exported mesh may change.
+        """
+        return (self.version, self.geometry_key(), self.transform.tobytes())
+
     def manipulate(self, **kwargs) -> None:
         self.parameters.update(kwargs)
+        self.mark_dirty()
         self.build()
 
-    def get_mesh(self):
+    def get_mesh(self, quality: Optional[float] = None):
+        """
+        Return the placed mesh. ``quality`` scales the tessellation tolerance
+        relative to the object's size where the object supports it.
+        """
         raise NotImplementedError("Subclasses must implement get_mesh()")
+
+    def get_solid(self):
+        """
+        Placed CadQuery solid for boolean operations, or None for mesh-only
+        objects.
+        """
+        return None
+
+    def estimate_triangles(self, quality: Optional[float] = None) -> Optional[int]:
+        """
+        Cheap estimate of the triangle count at ``quality``, or None if the
+        object cannot tell without meshing.
+        """
+        return None
+
+    def count_triangles(self, quality: Optional[float] = None) -> int:
+        """
+        Actual triangle count of the mesh at ``quality``.
+        """
+        return len(self.get_mesh(quality).faces)
+
+    def geometry_key(self) -> Optional[Hashable]:
+        """
+        Key identifying this object's untransformed geometry, or None.
+
+        Objects with equal keys produce the same mesh up to ``transform`` and
+        may be tessellated once and instanced by the scene.
+        """
+        return None
@@ -1,6 +1,8 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Sequence
 import trimesh
-from strategies.organic_model import OrganicModelStrategy
+from instrumentation import span
+from meshing.transforms import apply_transform, is_identity
+from strategies.organic_model import OrganicModelStrategy, build_organic_meshes
 from .base_object import BaseObject
 
 class OrganicObject(BaseObject):
@@ -10,10 +12,38 @@ class OrganicObject(BaseObject):
         self.mesh = None
 
     def build(self) -> None:
-        self.strategy.build_model(self.parameters)
+        with span("build", self):
+            self.strategy.build_model(self.parameters)
+        self.mark_dirty()
         self.mesh = self.strategy.get_mesh()
 
-    def get_mesh(self) -> trimesh.Trimesh:
+    @classmethod
+    def build_many(
+        cls, parameter_list: Sequence[Dict[str, Any]]
+    ) -> List["OrganicObject"]:
+        """
+        Create and build one object per parameter dict in a batched pass.
+        """
+        objects = [cls(parameters) for parameters in parameter_list]
+        with span("build"):
+            meshes = build_organic_meshes([obj.parameters for obj in objects])
+        for obj, mesh in zip(objects, meshes):
+            obj.strategy.mesh = mesh
+            obj.mesh = mesh
+            obj.mark_dirty()
+        return objects
+
+    def estimate_triangles(self, quality: Optional[float] = None) -> int:
+        return 20 * 4 ** self.parameters.get("subdivisions", 3)
+
+    def get_mesh(self, quality: Optional[float] = None) -> trimesh.Trimesh:
+        # Resolution is set by the "subdivisions" parameter; quality is unused.
         if self.mesh is None:
             self.build()
-        return self.mesh
+        if is_identity(self.transform):
+            return self.mesh
+        return trimesh.Trimesh(
+            vertices=apply_transform(self.mesh.vertices, self.transform),
+            faces=self.mesh.faces.copy(),
+            process=False,
+        )
@@ -1,4 +1,7 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from instrumentation import span
+from meshing.boolean import transform_shape
+from meshing.transforms import apply_transform, is_identity
 from strategies.precision_model import PrecisionModelStrategy
 from .base_object import BaseObject
 
@@ -10,10 +13,23 @@ class PrecisionObject(BaseObject):
         self.model = None
 
     def build(self) -> None:
-        self.strategy.build_model(self.parameters)
+        with span("build", self):
+            self.strategy.build_model(self.parameters)
+        self.mark_dirty()
         self.model = self.strategy.get_model()
 
-    def get_mesh(self):
+    def estimate_triangles(self, quality: Optional[float] = None) -> int:
+        return 12
+
+    def get_solid(self):
+        if self.model is None:
+            self.build()
+        return transform_shape(self.model.val(), self.transform)
+
+    def get_mesh(self, quality: Optional[float] = None):
         if self.model is None:
             self.build()
-        return self.strategy.get_mesh()
+        mesh = self.strategy.get_mesh(quality)
+        if not is_identity(self.transform):
+            mesh.vertices = apply_transform(mesh.vertices, self.transform)
+        return mesh
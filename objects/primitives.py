@@ -1,46 +1,221 @@
+import math
+
 import cadquery as cq
 import numpy as np
 import trimesh
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
+from instrumentation import span
+from meshing import analytic
+from meshing.boolean import transform_shape
+from meshing.cache import TessellationCache, get_default_cache
+from meshing.tessellation import tessellate_shape
+from meshing.transforms import apply_transform
 from .base_object import BaseObject
 
 
-class Cube(BaseObject):
+MESH_BACKENDS = ("cadquery", "analytic")
+
+
+class Primitive(BaseObject):
     """
-    Cube object.
+    Shared build/mesh logic for the CadQuery primitives.
 
-    Parameters:
-      - length: cube length (default 10)
-      - width: cube width (default 10)
-      - height: cube height (default 10)
+    Subclasses declare their parameter ``defaults`` and implement
+    ``create_model``. Tessellation results are looked up in a
+    ``TessellationCache`` keyed by the class name and the parameters merged
+    with the defaults, so unchanged parts are never re-tessellated.
+
+    With ``backend="analytic"`` the mesh is generated directly by the NumPy
+    generators in ``meshing.analytic`` and CadQuery is not used at all.
+    ``backend=None`` defers to the scene default (see ``Scene``), falling
+    back to ``"cadquery"``.
+
+    ``quality`` switches from the fixed ``tolerance`` to one relative to the
+    part's size: the linear tolerance becomes ``relative_tolerance`` times
+    the bounding-box diagonal divided by ``quality``, and the angular
+    tolerance is divided by ``quality`` as well.
     """
 
-    def __init__(self, parameters: Dict[str, Any] = None) -> None:
+    defaults: Dict[str, Any] = {}
+    tolerance = 0.1
+    angular_tolerance = 0.1
+    relative_tolerance = 0.005
+    # Typical ratio of OCC to analytic triangle counts at equal tolerances.
+    occ_triangle_ratio = 1.0
+
+    def __init__(
+        self,
+        parameters: Dict[str, Any] = None,
+        cache: Optional[TessellationCache] = None,
+        backend: Optional[str] = None,
+        quality: Optional[float] = None,
+    ) -> None:
         super().__init__(parameters)
+        if backend not in MESH_BACKENDS + (None,):
+            raise ValueError(f"Backend must be one of {MESH_BACKENDS}")
         self.model = None
+        self.cache = cache
+        self.backend = backend
+        self.quality = quality
+        self._built_model = None
+
+    def normalized_parameters(self) -> Dict[str, Any]:
+        return {**self.defaults, **self.parameters}
+
+    def create_model(self, parameters: Dict[str, Any]):
+        raise NotImplementedError("Subclasses must implement create_model()")
+
+    def analytic_mesh(
+        self, parameters: Dict[str, Any], tolerance: float, angular_tolerance: float
+    ):
+        raise NotImplementedError("Subclasses must implement analytic_mesh()")
+
+    def analytic_triangle_count(
+        self, parameters: Dict[str, Any], tolerance: float, angular_tolerance: float
+    ) -> int:
+        _, faces = self.analytic_mesh(parameters, tolerance, angular_tolerance)
+        return len(faces)
+
+    def nominal_size(self, parameters: Dict[str, Any]) -> float:
+        """
+        Bounding-box diagonal of the untransformed primitive.
+        """
+        raise NotImplementedError("Subclasses must implement nominal_size()")
 
     def build(self) -> None:
-        length = self.parameters.get("length", 10)
-        width = self.parameters.get("width", 10)
-        height = self.parameters.get("height", 10)
-        self.model = cq.Workplane("XY").box(length, width, height)
+        with span("build", self):
+            self.model = self.create_model(self.normalized_parameters())
+        self._built_model = self.model
+
+    def is_parametric(self) -> bool:
+        """
+        False once the model has been moved or edited after build(), as its
+        geometry is then no longer described by the parameters alone.
+        """
+        return self.model is None or self.model is self._built_model
+
+    def bounding_size(self) -> float:
+        if self.is_parametric():
+            return self.nominal_size(self.normalized_parameters())
+        return self.model.val().BoundingBox().DiagonalLength
+
+    def tolerances(self, quality: Optional[float] = None) -> Tuple[float, float]:
+        """
+        Linear and angular tolerance for ``quality``, falling back to
+        ``self.quality`` and then to the fixed class tolerances.
+        """
+        if quality is None:
+            quality = self.quality
+        if quality is None:
+            return self.tolerance, self.angular_tolerance
+        if quality <= 0:
+            raise ValueError("Quality must be positive")
+        return (
+            self.bounding_size() * self.relative_tolerance / quality,
+            self.angular_tolerance / quality,
+        )
+
+    def estimate_triangles(self, quality: Optional[float] = None) -> Optional[int]:
+        if not self.is_parametric():
+            return None
+        count = self.analytic_triangle_count(
+            self.normalized_parameters(), *self.tolerances(quality)
+        )
+        if self.backend == "analytic":
+            return count
+        return math.ceil(count * self.occ_triangle_ratio)
 
-    def get_mesh(self):
+    def count_triangles(self, quality: Optional[float] = None) -> int:
+        if self.backend == "analytic" and self.is_parametric():
+            return self.estimate_triangles(quality)
+        return len(self.mesh_arrays(quality)[1])
+
+    def tessellate(
+        self, quality: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
         if self.model is None:
             self.build()
-        tessellation = self.model.val().tessellate(0.1, 0.1)
-        vertices, faces = tessellation
-        try:
-            vertices = np.array(
-                [[float(v.x), float(v.y), float(v.z)] for v in vertices]
-            )
-        except AttributeError:
-            vertices = np.array(vertices, dtype=float)
+        with span("tessellate", self):
+            return tessellate_shape(self.model, *self.tolerances(quality))
+
+    def geometry_key(self):
+        if not self.is_parametric():
+            return None
+        return TessellationCache.make_key(
+            f"{type(self).__name__}:{self.backend or 'cadquery'}",
+            self.normalized_parameters(),
+            self.tolerances(),
+        )
+
+    def state_token(self):
+        if self.is_parametric():
+            return super().state_token()
+        return super().state_token(), id(self.model)
+
+    def mesh_arrays(
+        self, quality: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Untransformed ``(vertices, faces)`` of the primitive.
+        """
+        if not self.is_parametric():
+            return self.tessellate(quality)
+        parameters = self.normalized_parameters()
+        tolerances = self.tolerances(quality)
+        if self.backend == "analytic":
+            return self.analytic_mesh(parameters, *tolerances)
+        cache = self.cache if self.cache is not None else get_default_cache()
+        key = cache.make_key(type(self).__name__, parameters, tolerances)
+        return cache.get_or_compute(key, lambda: self.tessellate(quality))
+
+    def get_solid(self):
+        if self.model is None:
+            self.build()
+        return transform_shape(self.model.val(), self.transform)
+
+    def get_mesh(self, quality: Optional[float] = None):
+        vertices, faces = self.mesh_arrays(quality)
+        vertices = apply_transform(vertices, self.transform)
         return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
 
 
-class Sphere(BaseObject):
+class Cube(Primitive):
+    """
+    Cube object.
+
+    Parameters:
+      - length: cube length (default 10)
+      - width: cube width (default 10)
+      - height: cube height (default 10)
+    """
+
+    defaults = {"length": 10, "width": 10, "height": 10}
+
+    def create_model(self, parameters: Dict[str, Any]):
+        return cq.Workplane("XY").box(
+            parameters["length"], parameters["width"], parameters["height"]
+        )
+
+    def analytic_mesh(
+        self, parameters: Dict[str, Any], tolerance: float, angular_tolerance: float
+    ):
+        return analytic.box_mesh(
+            parameters["length"], parameters["width"], parameters["height"]
+        )
+
+    def analytic_triangle_count(
+        self, parameters: Dict[str, Any], tolerance: float, angular_tolerance: float
+    ) -> int:
+        return 12
+
+    def nominal_size(self, parameters: Dict[str, Any]) -> float:
+        return math.hypot(
+            parameters["length"], parameters["width"], parameters["height"]
+        )
+
+
+class Sphere(Primitive):
     """
     Sphere object.
 
@@ -48,29 +223,30 @@ class Sphere(BaseObject):
       - radius: sphere radius (default 5)
     """
 
-    def __init__(self, parameters: Dict[str, Any] = None) -> None:
-        super().__init__(parameters)
-        self.model = None
+    defaults = {"radius": 5}
+    occ_triangle_ratio = 2.1
 
-    def build(self) -> None:
-        radius = self.parameters.get("radius", 5)
-        self.model = cq.Workplane("XY").sphere(radius)
+    def create_model(self, parameters: Dict[str, Any]):
+        return cq.Workplane("XY").sphere(parameters["radius"])
 
-    def get_mesh(self):
-        if self.model is None:
-            self.build()
-        tessellation = self.model.val().tessellate(0.1, 0.1)
-        vertices, faces = tessellation
-        try:
-            vertices = np.array(
-                [[float(v.x), float(v.y), float(v.z)] for v in vertices]
-            )
-        except AttributeError:
-            vertices = np.array(vertices, dtype=float)
-        return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+    def analytic_mesh(
+        self, parameters: Dict[str, Any], tolerance: float, angular_tolerance: float
+    ):
+        return analytic.sphere_mesh(parameters["radius"], tolerance, angular_tolerance)
+
+    def analytic_triangle_count(
+        self, parameters: Dict[str, Any], tolerance: float, angular_tolerance: float
+    ) -> int:
+        segments = analytic.sphere_segment_count(
+            parameters["radius"], tolerance, angular_tolerance
+        )
+        return 2 * segments * (max(2, (segments + 1) // 2) - 1)
 
+    def nominal_size(self, parameters: Dict[str, Any]) -> float:
+        return 2 * math.sqrt(3) * parameters["radius"]
 
-class Cylinder(BaseObject):
+
+class Cylinder(Primitive):
     """
     Cylinder object.
 
@@ -79,30 +255,32 @@ class Cylinder(BaseObject):
       - radius: cylinder radius (default 3)
     """
 
-    def __init__(self, parameters: Dict[str, Any] = None) -> None:
-        super().__init__(parameters)
-        self.model = None
+    defaults = {"height": 10, "radius": 3}
+    occ_triangle_ratio = 2.0
 
-    def build(self) -> None:
-        height = self.parameters.get("height", 10)
-        radius = self.parameters.get("radius", 3)
-        self.model = cq.Workplane("XY").cylinder(height, radius)
+    def create_model(self, parameters: Dict[str, Any]):
+        return cq.Workplane("XY").cylinder(parameters["height"], parameters["radius"])
 
-    def get_mesh(self):
-        if self.model is None:
-            self.build()
-        tessellation = self.model.val().tessellate(0.1, 0.1)
-        vertices, faces = tessellation
-        try:
-            vertices = np.array(
-                [[float(v.x), float(v.y), float(v.z)] for v in vertices]
-            )
-        except AttributeError:
-            vertices = np.array(vertices, dtype=float)
-        return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+    def analytic_mesh(
+        self, parameters: Dict[str, Any], tolerance: float, angular_tolerance: float
+    ):
+        return analytic.cylinder_mesh(
+            parameters["height"], parameters["radius"], tolerance, angular_tolerance
+        )
+
+    def analytic_triangle_count(
+        self, parameters: Dict[str, Any], tolerance: float, angular_tolerance: float
+    ) -> int:
+        return 4 * analytic.segment_count(
+            parameters["radius"], tolerance, angular_tolerance
+        )
 
+    def nominal_size(self, parameters: Dict[str, Any]) -> float:
+        diameter = 2 * parameters["radius"]
+        return math.hypot(diameter, diameter, parameters["height"])
 
-class Pyramid(BaseObject):
+
+class Pyramid(Primitive):
     """
     Pyramid object with a square base.
 
@@ -111,30 +289,28 @@ class Pyramid(BaseObject):
       - height: pyramid height (default 15)
     """
 
-    def __init__(self, parameters: Dict[str, Any] = None) -> None:
-        super().__init__(parameters)
-        self.model = None
+    defaults = {"base": 10, "height": 15}
 
-    def build(self) -> None:
-        base = self.parameters.get("base", 10)
-        height = self.parameters.get("height", 15)
-        self.model = (
+    def create_model(self, parameters: Dict[str, Any]):
+        base = parameters["base"]
+        return (
             cq.Workplane("XY")
             .rect(base, base)
-            .workplane(offset=height)
+            .workplane(offset=parameters["height"])
             .rect(0.001, 0.001)
             .loft(ruled=True, combine=True)
         )
 
-    def get_mesh(self):
-        if self.model is None:
-            self.build()
-        tessellation = self.model.val().tessellate(0.1, 0.1)
-        vertices, faces = tessellation
-        try:
-            vertices = np.array(
-                [[float(v.x), float(v.y), float(v.z)] for v in vertices]
-            )
-        except AttributeError:
-            vertices = np.array(vertices, dtype=float)
-        return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+    def analytic_mesh(
+        self, parameters: Dict[str, Any], tolerance: float, angular_tolerance: float
+    ):
+        return analytic.pyramid_mesh(parameters["base"], parameters["height"])
+
+    def analytic_triangle_count(
+        self, parameters: Dict[str, Any], tolerance: float, angular_tolerance: float
+    ) -> int:
+        return 12
+
+    def nominal_size(self, parameters: Dict[str, Any]) -> float:
+        base = parameters["base"]
+        return math.hypot(base, base, parameters["height"])
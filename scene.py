@@ -1,22 +1,489 @@
-from typing import List
+import math
+from typing import Iterator, List, Optional
+from weakref import WeakKeyDictionary
+import numpy as np
+import trimesh
 from objects.base_object import BaseObject
-from exporters.stl_exporter import STLExporter
+from exporters import exporter_for
+from exporters.base_exporter import MeshExporter
+from exporters.stl_exporter import STLExporter, STLStreamWriter, pack_stl_records
+from instrumentation import ExportStats, Recorder, active_recorder, recording, span
+from meshing.instancing import expand_instances, group_instances
+from meshing.parallel import iter_meshes_parallel
+from meshing.welding import weld_vertices
+
+MIN_QUALITY = 0.01
+MAX_QUALITY = 100.0
+BUDGET_BACKOFF = 0.9
+DEFAULT_FUSED_TOLERANCES = (0.1, 0.1)
+FUSED_WELD_TOLERANCE = 1e-8
+# Triangle/box pairs compared at once when attributing fused triangles.
+FUSED_ATTRIBUTION_PAIRS = 1 << 20
+
 
 class Scene:
-    def __init__(self, mode: str = "precision") -> None:
+    def __init__(
+        self,
+        mode: str = "precision",
+        mesh_backend: Optional[str] = None,
+        triangle_budget: Optional[int] = None,
+    ) -> None:
         if mode not in ("organic", "precision"):
             raise ValueError("Mode must be 'organic' or 'precision'")
+        if mesh_backend not in ("cadquery", "analytic", None):
+            raise ValueError("Mesh backend must be 'cadquery' or 'analytic'")
         self.mode = mode
+        self.mesh_backend = mesh_backend
+        self.triangle_budget = triangle_budget
         self.objects: List[BaseObject] = []
+        # object -> [(state token, weld tolerance), mesh, packed STL records or None]
+        self._last_meshes: "WeakKeyDictionary[BaseObject, list]" = WeakKeyDictionary()
 
     def add(self, obj: BaseObject) -> None:
+        if self.mesh_backend is not None and getattr(obj, "backend", "") is None:
+            obj.backend = self.mesh_backend
         self.objects.append(obj)
 
     def remove(self, obj: BaseObject) -> None:
         self.objects.remove(obj)
+        self._last_meshes.pop(obj, None)
+
+    def apply_triangle_budget(self, budget: Optional[int] = None) -> Optional[float]:
+        """
+        Pick one ``quality`` for every size-adaptive object so that the
+        scene triangle count fits ``budget``.
+
+        Because tolerances are relative to each object's size, a shared
+        quality spreads the budget evenly in relative accuracy. The quality
+        is bisected on the cheap estimates, then the actual counts at that
+        quality are checked (meshing through the tessellation cache, so the
+        export reuses them); objects whose backend meshes more densely than
+        estimated (e.g. OCC) get their estimates scaled accordingly and the
+        quality is bisected again. Size-adaptive objects that cannot estimate
+        their count (e.g. a primitive whose model was replaced after
+        ``build()``) start from a power law fitted to their actual counts
+        at qualities 1 and 1/2, and are corrected by the same checks; other
+        objects count towards the budget as they are. If even
+        ``MIN_QUALITY`` does not fit, it is used anyway. Returns the chosen quality, or None if
+        nothing could be adjusted.
+        """
+        budget = budget if budget is not None else self.triangle_budget
+        if budget is None:
+            return None
+        adjustable = []
+        estimators = []
+        fixed = 0
+        for obj in self.objects:
+            if not hasattr(obj, "quality"):
+                estimate = obj.estimate_triangles()
+                fixed += estimate if estimate is not None else obj.count_triangles()
+                continue
+            adjustable.append(obj)
+            if obj.estimate_triangles(1.0) is not None:
+                estimators.append(obj.estimate_triangles)
+            else:
+                # Fit ``count = measured * quality ** exponent`` to two meshes.
+                measured = obj.count_triangles(1.0)
+                halved = max(obj.count_triangles(0.5), 1)
+                exponent = max(math.log2(measured / halved), 0.0)
+                estimators.append(
+                    lambda quality, measured=measured, exponent=exponent: (
+                        measured * quality**exponent
+                    )
+                )
+        if not adjustable:
+            return None
+        remaining = budget - fixed
+        ratios = [1.0] * len(adjustable)
+
+        def total(quality: float) -> float:
+            return sum(
+                ratio * estimate(quality)
+                for ratio, estimate in zip(ratios, estimators)
+            )
+
+        quality = self._bisect_quality(total, remaining)
+        while quality > MIN_QUALITY:
+            counts = [obj.count_triangles(quality) for obj in adjustable]
+            if sum(counts) <= remaining:
+                break
+            ratios = [
+                count / max(estimate(quality), 1)
+                for count, estimate in zip(counts, estimators)
+            ]
+            # Step below the previous choice even if the new estimates
+            # disagree, so every round moves towards the budget.
+            quality = min(
+                self._bisect_quality(total, remaining),
+                quality * BUDGET_BACKOFF,
+            )
+            quality = max(quality, MIN_QUALITY)
+        for obj in adjustable:
+            obj.quality = quality
+        return quality
+
+    @staticmethod
+    def _bisect_quality(total, remaining: float) -> float:
+        """
+        Highest quality in ``[MIN_QUALITY, MAX_QUALITY]`` whose ``total``
+        fits ``remaining``, or ``MIN_QUALITY`` if none does.
+        """
+        low, high = MIN_QUALITY, MAX_QUALITY
+        if total(high) <= remaining:
+            return high
+        if total(low) > remaining:
+            return low
+        # Bisect in log space; triangle counts grow monotonically.
+        for _ in range(32):
+            middle = math.sqrt(low * high)
+            if total(middle) <= remaining:
+                low = middle
+            else:
+                high = middle
+        return low
+
+    @staticmethod
+    def _mesh_serial(objects: List[BaseObject]) -> Iterator[trimesh.Trimesh]:
+        recorder = active_recorder()
+        for obj in objects:
+            with span("get_mesh", obj):
+                mesh = obj.get_mesh()
+            if recorder is not None:
+                recorder.count_object_triangles(obj, len(mesh.faces))
+            yield mesh
+
+    @staticmethod
+    def _mesh_parallel(
+        objects: List[BaseObject], max_workers: Optional[int]
+    ) -> Iterator[trimesh.Trimesh]:
+        recorder = active_recorder()
+        for obj, mesh in zip(objects, iter_meshes_parallel(objects, max_workers)):
+            if recorder is not None:
+                recorder.count_object_triangles(obj, len(mesh.faces))
+            yield mesh
+
+    @staticmethod
+    def _count_fused_triangles(
+        objects: List[BaseObject], solids: list, mesh: trimesh.Trimesh
+    ) -> None:
+        """
+        Attribute the fused mesh's triangles to the objects it came from.
+
+        The union keeps no per-face history, so each triangle is counted
+        for the first object whose bounding box contains its centroid (or
+        the nearest box, for centroids on no box).
+        """
+        recorder = active_recorder()
+        if recorder is None or not objects:
+            return
+        boxes = [solid.BoundingBox() for solid in solids]
+        low = np.array([(box.xmin, box.ymin, box.zmin) for box in boxes])
+        high = np.array([(box.xmax, box.ymax, box.zmax) for box in boxes])
+        counts = np.zeros(len(objects), dtype=np.int64)
+        faces = mesh.faces
+        chunk = max(1, FUSED_ATTRIBUTION_PAIRS // len(objects))
+        for start in range(0, len(faces), chunk):
+            centroids = mesh.vertices[faces[start : start + chunk]]
+            centroids = centroids.mean(axis=1)[:, None, :]
+            outside = np.maximum(low - centroids, 0) + np.maximum(centroids - high, 0)
+            nearest = np.argmin(np.einsum("mkd,mkd->mk", outside, outside), axis=1)
+            counts += np.bincount(nearest, minlength=len(objects))
+        for obj, count in zip(objects, counts):
+            recorder.count_object_triangles(obj, int(count))
+
+    @staticmethod
+    def _weld_mesh(mesh: trimesh.Trimesh, tolerance: float) -> trimesh.Trimesh:
+        with span("weld"):
+            vertices, faces, merged = weld_vertices(
+                mesh.vertices, mesh.faces, tolerance
+            )
+        recorder = active_recorder()
+        if recorder is not None:
+            recorder.count_welded(merged)
+        return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+    def refresh_meshes(
+        self,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        weld: Optional[float] = None,
+    ) -> int:
+        """
+        Re-mesh only the objects whose ``state_token()`` changed since they
+        were last meshed by this scene, welding them at ``weld`` if given.
+        Returns the number re-meshed.
+        """
+        dirty = [
+            obj
+            for obj in self.objects
+            if obj not in self._last_meshes
+            or self._last_meshes[obj][0] != (obj.state_token(), weld)
+        ]
+        if parallel:
+            meshes = self._mesh_parallel(dirty, max_workers)
+        else:
+            meshes = self._mesh_serial(dirty)
+        for obj, mesh in zip(dirty, meshes):
+            if weld is not None:
+                mesh = self._weld_mesh(mesh, weld)
+            # Taken after meshing, since a lazy build may bump the version.
+            self._last_meshes[obj] = [(obj.state_token(), weld), mesh, None]
+        return len(dirty)
+
+    def _export_incremental(
+        self,
+        filename: str,
+        parallel: bool,
+        max_workers: Optional[int],
+        streaming: bool,
+        weld: Optional[float],
+    ) -> None:
+        self.refresh_meshes(parallel, max_workers, weld)
+        entries = [self._last_meshes[obj] for obj in self.objects]
+        if not entries:
+            raise ValueError("No meshes to combine.")
+        if not streaming:
+            exporter = STLExporter()
+            combined_mesh = exporter.combine_meshes([entry[1] for entry in entries])
+            exporter.export(combined_mesh, filename)
+            return
+        with span("export"), STLStreamWriter(filename) as writer:
+            for entry in entries:
+                if entry[2] is None:
+                    entry[2] = pack_stl_records(entry[1].vertices, entry[1].faces)
+                writer.write_records(entry[2])
+
+    @staticmethod
+    def _mesh_arrays_serial(objects: List[BaseObject]):
+        for obj in objects:
+            with span("get_mesh", obj):
+                arrays = obj.mesh_arrays()
+            yield arrays
+
+    def iter_meshes(
+        self,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        instancing: bool = False,
+    ) -> Iterator[trimesh.Trimesh]:
+        """
+        Yield the meshes to export, one per object or per instance group.
+
+        With ``instancing`` enabled, objects sharing a ``geometry_key()`` are
+        meshed once and expanded by their transforms in a single batched
+        matmul; groups are yielded first, in order of their first member,
+        followed by the remaining objects.
+        """
+        if not instancing:
+            if parallel:
+                yield from self._mesh_parallel(self.objects, max_workers)
+            else:
+                yield from self._mesh_serial(self.objects)
+            return
+        groups, unique = group_instances(self.objects)
+        representatives = [group.representative for group in groups]
+        if parallel:
+            shared = iter_meshes_parallel(representatives, max_workers, local=True)
+            shared = ((mesh.vertices, mesh.faces) for mesh in shared)
+        else:
+            shared = self._mesh_arrays_serial(representatives)
+        recorder = active_recorder()
+        for group, (vertices, faces) in zip(groups, shared):
+            if recorder is not None:
+                for obj in group.objects:
+                    recorder.count_object_triangles(obj, len(faces))
+            vertices, faces = expand_instances(vertices, faces, group.transforms())
+            yield trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+        if parallel:
+            yield from self._mesh_parallel(unique, max_workers)
+        else:
+            yield from self._mesh_serial(unique)
+
+    def fused_meshes(
+        self, parallel: bool = False, max_workers: Optional[int] = None
+    ) -> List[trimesh.Trimesh]:
+        """
+        Union every object's solid into one watertight body and mesh it.
+
+        Solids are fused by a balanced pairwise reduction whose rounds run
+        in a process pool when ``parallel`` is set. The fused body is meshed
+        at the finest tolerance requested by any object and its coincident
+        face-boundary vertices are merged. Mesh-only objects (e.g. organic
+        ones) cannot take part and are returned as separate meshes.
+        """
+        # Imported lazily: the boolean path needs CadQuery/OCC.
+        # pylint: disable=import-outside-toplevel
+        from meshing.boolean import fuse_shapes
+        from meshing.tessellation import tessellate_shape
+
+        solid_objects, solids, loose = [], [], []
+        tolerance, angular_tolerance = DEFAULT_FUSED_TOLERANCES
+        for obj in self.objects:
+            with span("build", obj):
+                solid = obj.get_solid()
+            if solid is None:
+                loose.append(obj)
+                continue
+            solid_objects.append(obj)
+            solids.append(solid)
+            if hasattr(obj, "tolerances"):
+                linear, angular = obj.tolerances()
+                tolerance = min(tolerance, linear)
+                angular_tolerance = min(angular_tolerance, angular)
+        meshes = []
+        if solids:
+            with span("fuse"):
+                fused = fuse_shapes(solids, parallel, max_workers)
+            with span("tessellate"):
+                vertices, faces = tessellate_shape(fused, tolerance, angular_tolerance)
+            mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+            mesh = self._weld_mesh(mesh, FUSED_WELD_TOLERANCE)
+            # Collapsed pole/seam triangles would otherwise break the closure.
+            mesh.update_faces(mesh.nondegenerate_faces())
+            mesh.remove_unreferenced_vertices()
+            self._count_fused_triangles(solid_objects, solids, mesh)
+            meshes.append(mesh)
+        meshes.extend(self._mesh_serial(loose))
+        return meshes
+
+    def export_stl(
+        self,
+        filename: str,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        streaming: bool = False,
+        instancing: bool = False,
+        incremental: bool = False,
+        fused: bool = False,
+        weld: Optional[float] = None,
+        recorder: Optional[Recorder] = None,
+    ) -> Optional[ExportStats]:
+        """
+        Export the scene to a binary STL file.
+
+        ``parallel`` meshes objects in a process pool, ``streaming`` writes
+        triangles as they are produced instead of concatenating the scene,
+        ``instancing`` meshes repeated geometry once, and ``incremental``
+        reuses the meshes (and packed STL records) of objects unchanged since
+        the previous export. ``incremental`` takes precedence over
+        ``instancing``. ``fused`` unions all solids into one watertight body
+        first (see ``fused_meshes``) and ignores the other meshing options.
+        ``weld`` merges each mesh's vertices that coincide within that
+        tolerance (see ``meshing.welding``) and drops collapsed triangles;
+        the number merged is reported as ``ExportStats.vertices_merged``.
+        If the scene has a ``triangle_budget`` the object qualities are
+        re-balanced to fit it first.
+
+        Pass a ``Recorder`` to collect per-stage and per-object timings,
+        triangle counts and bytes written; its ``ExportStats`` is returned.
+        """
+        if recorder is None:
+            self._export(
+                filename,
+                parallel,
+                max_workers,
+                streaming,
+                instancing,
+                incremental,
+                fused,
+                weld,
+            )
+            return None
+        with recording(recorder), span("export_stl"):
+            self._export(
+                filename,
+                parallel,
+                max_workers,
+                streaming,
+                instancing,
+                incremental,
+                fused,
+                weld,
+            )
+        return recorder.stats
+
+    def export(
+        self,
+        filename: str,
+        exporter: Optional[MeshExporter] = None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        instancing: bool = False,
+        fused: bool = False,
+        weld: Optional[float] = None,
+        recorder: Optional[Recorder] = None,
+    ) -> Optional[ExportStats]:
+        """
+        Export the scene as one combined mesh in any supported format.
+
+        ``exporter`` defaults to the one matching the file extension (see
+        ``exporters.exporter_for``); pass e.g. ``GLBExporter(position_bits=14)``
+        to quantize. The meshing and ``weld`` options behave as in
+        ``export_stl``.
+        """
+        if exporter is None:
+            exporter = exporter_for(filename)
+        if recorder is None:
+            self._export_combined(
+                filename, exporter, parallel, max_workers, instancing, fused, weld
+            )
+            return None
+        with recording(recorder), span("export_mesh"):
+            self._export_combined(
+                filename, exporter, parallel, max_workers, instancing, fused, weld
+            )
+        return recorder.stats
+
+    def _export_combined(
+        self,
+        filename: str,
+        exporter: MeshExporter,
+        parallel: bool,
+        max_workers: Optional[int],
+        instancing: bool,
+        fused: bool,
+        weld: Optional[float],
+    ) -> None:
+        self.apply_triangle_budget()
+        meshes = self._export_meshes(parallel, max_workers, instancing, fused, weld)
+        exporter.export(exporter.combine_meshes(list(meshes)), filename)
+
+    def _export_meshes(
+        self,
+        parallel: bool,
+        max_workers: Optional[int],
+        instancing: bool,
+        fused: bool,
+        weld: Optional[float],
+    ) -> Iterator[trimesh.Trimesh]:
+        if fused:
+            meshes = self.fused_meshes(parallel, max_workers)
+        else:
+            meshes = self.iter_meshes(parallel, max_workers, instancing)
+        if weld is None:
+            return iter(meshes)
+        return (self._weld_mesh(mesh, weld) for mesh in meshes)
 
-    def export_stl(self, filename: str) -> None:
+    def _export(
+        self,
+        filename: str,
+        parallel: bool,
+        max_workers: Optional[int],
+        streaming: bool,
+        instancing: bool,
+        incremental: bool,
+        fused: bool,
+        weld: Optional[float],
+    ) -> None:
+        self.apply_triangle_budget()
+        if incremental and not fused:
+            self._export_incremental(filename, parallel, max_workers, streaming, weld)
+            return
         exporter = STLExporter()
-        meshes = [obj.get_mesh() for obj in self.objects]
+        meshes = self._export_meshes(parallel, max_workers, instancing, fused, weld)
+        if streaming:
+            exporter.export_stream(meshes, filename)
+            return
+        meshes = list(meshes)
         combined_mesh = exporter.combine_meshes(meshes)
         exporter.export(combined_mesh, filename)
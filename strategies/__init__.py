@@ -1,5 +1,8 @@
+from lazy_imports import lazy_attributes
+
 from .modeling_strategy import ModelingStrategy
 from .organic_model import OrganicModelStrategy
-from .precision_model import PrecisionModelStrategy
+
+__getattr__ = lazy_attributes(__name__, {"PrecisionModelStrategy": ".precision_model"})
 
 __all__ = ["ModelingStrategy", "OrganicModelStrategy", "PrecisionModelStrategy"]
@@ -1,23 +1,132 @@
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Sequence, Tuple
 import trimesh
 import numpy as np
 from .modeling_strategy import ModelingStrategy
 
 
+HIGH_RESOLUTION_LEVEL = 7
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+
+@lru_cache(maxsize=None)
+def base_icosphere(
+    subdivisions: int, compact: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Unit icosphere for a subdivision level, computed once per process.
+
+    With ``compact`` the vertices are stored as float32. Faces stay int64,
+    the dtype trimesh stores, so a mesh's own copy is a plain memcpy. The
+    returned arrays are read-only and shared: scale the vertices into a new
+    array and copy the faces before handing them out.
+    """
+    mesh = trimesh.creation.icosphere(subdivisions=subdivisions, radius=1.0)
+    vertices = np.array(mesh.vertices, dtype=np.float32 if compact else np.float64)
+    faces = np.array(mesh.faces, dtype=np.int64)
+    del mesh
+    vertices.flags.writeable = False
+    faces.flags.writeable = False
+    return vertices, faces
+
+
 class OrganicModelStrategy(ModelingStrategy):
+    """
+    Noisy icosphere blobs.
+
+    Parameters:
+      - radius: base sphere radius (default 1.0)
+      - subdivisions: icosphere subdivision level (default 3)
+      - noise_scale: standard deviation of the vertex noise (default 0.1)
+      - seed: seed for the object's own random generator; the same seed
+        always produces the same mesh (default None, i.e. fresh entropy)
+      - high_resolution: memory-bounded mode; the base sphere is cached in
+        float32 and float32 noise is drawn and added in place, chunk by
+        chunk, so peak memory stays close to the final mesh (default: on from
+        subdivision level 7). Noise differs from the default mode for the same
+        seed.
+      - chunk_size: vertices displaced per chunk in high-resolution mode
+        (default 262144)
+    """
+
     def __init__(self) -> None:
         self.mesh = None
 
     def build_model(self, parameters: Dict[str, Any]) -> None:
-        radius = parameters.get("radius", 1.0)
-        subdivisions = parameters.get("subdivisions", 3)
-        noise_scale = parameters.get("noise_scale", 0.1)
-        base_mesh = trimesh.creation.icosphere(subdivisions=subdivisions, radius=radius)
-        noise = noise_scale * np.random.randn(*base_mesh.vertices.shape)
-        base_mesh.vertices += noise
-        self.mesh = base_mesh
+        self.mesh = build_organic_meshes([parameters])[0]
 
     def get_mesh(self):
         if self.mesh is None:
             raise ValueError("The organic model has not been built yet.")
         return self.mesh
+
+
+def build_organic_meshes(
+    parameter_list: Sequence[Dict[str, Any]]
+) -> List[trimesh.Trimesh]:
+    """
+    Build one organic mesh per parameter dict.
+
+    Objects sharing a subdivision level are generated together: their noise
+    is drawn into one stacked ``(n, vertices, 3)`` array (each slice from
+    the object's own seeded generator) and radius/noise scaling is applied
+    in a single vectorized pass. Results match building each object alone.
+    """
+    meshes: List[trimesh.Trimesh] = [None] * len(parameter_list)
+    by_level: Dict[int, List[int]] = {}
+    for index, parameters in enumerate(parameter_list):
+        subdivisions = parameters.get("subdivisions", 3)
+        high_resolution = parameters.get("high_resolution")
+        if high_resolution is None:
+            high_resolution = subdivisions >= HIGH_RESOLUTION_LEVEL
+        if high_resolution:
+            # Never stacked: one large mesh at a time keeps memory bounded.
+            meshes[index] = build_high_resolution_mesh(parameters)
+        else:
+            by_level.setdefault(subdivisions, []).append(index)
+
+    for subdivisions, indices in by_level.items():
+        unit_vertices, faces = base_icosphere(subdivisions)
+        stacked = np.empty((len(indices),) + unit_vertices.shape)
+        radii = np.empty(len(indices))
+        noise_scales = np.empty(len(indices))
+        for row, index in enumerate(indices):
+            parameters = parameter_list[index]
+            radii[row] = parameters.get("radius", 1.0)
+            noise_scales[row] = parameters.get("noise_scale", 0.1)
+            rng = np.random.default_rng(parameters.get("seed"))
+            rng.standard_normal(out=stacked[row])
+        stacked *= noise_scales[:, None, None]
+        stacked += unit_vertices[None, :, :] * radii[:, None, None]
+        for row, index in enumerate(indices):
+            meshes[index] = trimesh.Trimesh(
+                vertices=stacked[row], faces=faces.copy(), process=False
+            )
+    return meshes
+
+
+def build_high_resolution_mesh(parameters: Dict[str, Any]) -> trimesh.Trimesh:
+    """
+    Build one organic mesh with bounded peak memory.
+
+    The float64 vertex array that trimesh stores is allocated once and filled
+    chunk by chunk from the compact base sphere and a reusable float32 noise
+    buffer, instead of materialising full-size noise and scaled copies.
+    """
+    unit_vertices, faces = base_icosphere(parameters.get("subdivisions", 3), True)
+    radius = parameters.get("radius", 1.0)
+    noise_scale = np.float32(parameters.get("noise_scale", 0.1))
+    chunk_size = max(1, int(parameters.get("chunk_size", DEFAULT_CHUNK_SIZE)))
+    rng = np.random.default_rng(parameters.get("seed"))
+
+    vertices = np.empty(unit_vertices.shape, dtype=np.float64)
+    noise = np.empty((min(chunk_size, len(vertices)), 3), dtype=np.float32)
+    for start in range(0, len(vertices), chunk_size):
+        stop = min(start + chunk_size, len(vertices))
+        block = vertices[start:stop]
+        chunk_noise = noise[: stop - start]
+        np.multiply(unit_vertices[start:stop], radius, out=block)
+        rng.standard_normal(out=chunk_noise, dtype=np.float32)
+        chunk_noise *= noise_scale
+        block += chunk_noise
+    return trimesh.Trimesh(vertices=vertices, faces=faces.copy(), process=False)
@@ -1,18 +1,28 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import trimesh
-import numpy as np
 import cadquery as cq
+from instrumentation import span
+from meshing.cache import TessellationCache, get_default_cache
+from meshing.tessellation import tessellate_shape
 from .modeling_strategy import ModelingStrategy
 
 
 class PrecisionModelStrategy(ModelingStrategy):
-    def __init__(self) -> None:
+    defaults = {"length": 10, "width": 10, "height": 10}
+    tolerance = 0.55
+    angular_tolerance = 0.55
+    relative_tolerance = 0.03
+
+    def __init__(self, cache: Optional[TessellationCache] = None) -> None:
         self.model = None
+        self.parameters: Dict[str, Any] = {}
+        self.cache = cache
 
     def build_model(self, parameters: Dict[str, Any]) -> None:
-        length = parameters.get("length", 10)
-        width = parameters.get("width", 10)
-        height = parameters.get("height", 10)
+        self.parameters = {**self.defaults, **parameters}
+        length = self.parameters["length"]
+        width = self.parameters["width"]
+        height = self.parameters["height"]
         self.model = cq.Workplane("XY").box(length, width, height)
 
     def get_model(self):
@@ -20,15 +30,27 @@ class PrecisionModelStrategy(ModelingStrategy):
             raise ValueError("The precision model has not been built yet.")
         return self.model
 
-    def get_mesh(self):
+    def tolerances(self, quality: Optional[float] = None):
+        if quality is None:
+            return self.tolerance, self.angular_tolerance
+        if quality <= 0:
+            raise ValueError("Quality must be positive")
+        size = self.model.val().BoundingBox().DiagonalLength
+        return (
+            size * self.relative_tolerance / quality,
+            self.angular_tolerance / quality,
+        )
+
+    def tessellate(self, quality: Optional[float] = None):
+        with span("tessellate"):
+            return tessellate_shape(self.model, *self.tolerances(quality))
+
+    def get_mesh(self, quality: Optional[float] = None):
         if self.model is None:
             raise ValueError("The precision model has not been built yet.")
-        tessellation = self.model.val().tessellate(0.55, 0.55)
-        vertices, faces = tessellation
-        try:
-            vertices = np.array(
-                [[float(v.x), float(v.y), float(v.z)] for v in vertices]
-            )
-        except AttributeError:
-            vertices = np.array(vertices, dtype=float)
+        cache = self.cache if self.cache is not None else get_default_cache()
+        key = cache.make_key(
+            type(self).__name__, self.parameters, self.tolerances(quality)
+        )
+        vertices, faces = cache.get_or_compute(key, lambda: self.tessellate(quality))
         return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
@@ -0,0 +1,4 @@
+import os
+
+# Keep the tests off the user's on-disk tessellation cache.
+os.environ["FABRIC6_CACHE_DIR"] = ""
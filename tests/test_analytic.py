@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from meshing import analytic
+from objects.primitives import Cube, Cylinder, Pyramid, Sphere
+
+CASES = [
+    (Cube, {}),
+    (Cube, {"length": 3, "width": 40, "height": 0.5}),
+    (Sphere, {}),
+    (Sphere, {"radius": 0.2}),
+    (Sphere, {"radius": 80}),
+    (Cylinder, {}),
+    (Cylinder, {"height": 50, "radius": 0.5}),
+    (Pyramid, {}),
+    (Pyramid, {"base": 40, "height": 2}),
+]
+QUALITIES = [None, 0.5, 4.0]
+
+
+def _meshes(cls, parameters, quality):
+    analytic_obj = cls(dict(parameters), backend="analytic", quality=quality)
+    cadquery_obj = cls(dict(parameters), backend="cadquery", quality=quality)
+    tolerance, _ = analytic_obj.tolerances()
+    return analytic_obj.get_mesh(), cadquery_obj.get_mesh(), tolerance
+
+
+@pytest.mark.parametrize("quality", QUALITIES)
+@pytest.mark.parametrize("cls, parameters", CASES)
+def test_deviation_from_cadquery(cls, parameters, quality):
+    mesh, reference, tolerance = _meshes(cls, parameters, quality)
+
+    assert mesh.is_watertight
+    assert mesh.volume > 0
+    # Both meshes lie within ``tolerance`` of the same exact surface.
+    np.testing.assert_allclose(mesh.bounds, reference.bounds, rtol=0, atol=tolerance)
+    assert mesh.volume == pytest.approx(
+        reference.volume, abs=2 * tolerance * reference.area
+    )
+
+
+def _inner_points(vertices, faces):
+    """
+    Vertices plus points spread over every face, including the centroid.
+    """
+    weights = np.array(
+        [[1, 1, 1], [4, 1, 1], [1, 4, 1], [1, 1, 4], [1, 1, 0], [0, 1, 1], [1, 0, 1]],
+        dtype=np.float64,
+    )
+    weights /= weights.sum(axis=1, keepdims=True)
+    points = np.einsum("wk,fkd->fwd", weights, vertices[faces]).reshape(-1, 3)
+    return np.concatenate([vertices, points])
+
+
+@pytest.mark.parametrize("radius", [0.2, 5, 80])
+@pytest.mark.parametrize("tolerances", [(0.1, 0.1), (0.01, 0.1), (0.1, 0.5)])
+def test_sphere_surface_deviation(radius, tolerances):
+    vertices, faces = analytic.sphere_mesh(radius, *tolerances)
+    np.testing.assert_allclose(np.linalg.norm(vertices, axis=1), radius)
+    distance = radius - np.linalg.norm(_inner_points(vertices, faces), axis=1)
+    assert distance.min() >= -1e-9
+    assert distance.max() <= tolerances[0]
+
+
+@pytest.mark.parametrize("radius", [0.2, 3, 80])
+@pytest.mark.parametrize("tolerances", [(0.1, 0.1), (0.01, 0.1), (0.1, 0.5)])
+def test_cylinder_surface_deviation(radius, tolerances):
+    vertices, faces = analytic.cylinder_mesh(10, radius, *tolerances)
+    points = _inner_points(vertices, faces)
+    side = np.abs(np.abs(points[:, 2]) - 5) > 1e-9
+    distance = radius - np.linalg.norm(points[side, :2], axis=1)
+    assert distance.min() >= -1e-9
+    assert distance.max() <= tolerances[0]
+    assert np.linalg.norm(points[:, :2], axis=1).max() <= radius + 1e-9
+
+
+def test_triangle_estimate_matches_mesh():
+    for cls, parameters in CASES:
+        for quality in QUALITIES:
+            obj = cls(dict(parameters), backend="analytic", quality=quality)
+            assert obj.estimate_triangles() == len(obj.get_mesh().faces)
@@ -0,0 +1,53 @@
+import json
+import os
+
+import batch
+
+_run_job = batch.run_job
+
+
+def _job(tmp_path, name, object_type="Sphere"):
+    return {
+        "name": name,
+        "output": str(tmp_path / f"{name}.stl"),
+        "mesh_backend": "analytic",
+        "objects": [{"type": object_type, "parameters": {"radius": 2}}],
+    }
+
+
+def _crashing_run_job(spec):
+    # Stands in for a hard crash such as an OCC segfault.
+    if spec["name"] == "crash":
+        os._exit(1)
+    return _run_job(spec)
+
+
+def test_reports_every_job(tmp_path):
+    jobs = [
+        _job(tmp_path, "a"),
+        _job(tmp_path, "b", object_type="Nothing"),
+        _job(tmp_path, "c"),
+    ]
+    job_file = tmp_path / "jobs.json"
+    job_file.write_text(json.dumps({"jobs": jobs}))
+    report = tmp_path / "report.json"
+
+    assert batch.main([str(job_file), "--workers", "2", "--report", str(report)]) == 1
+
+    summary = json.loads(report.read_text())
+    assert [result["ok"] for result in summary["results"]] == [True, False, True]
+    assert os.path.exists(jobs[0]["output"])
+
+
+def test_worker_crash_fails_only_that_job(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch, "run_job", _crashing_run_job)
+    names = ["a", "b", "crash", "c", "d", "e"]
+    jobs = [_job(tmp_path, name) for name in names]
+
+    results = batch.run_jobs(jobs, workers=2)
+
+    assert [result["name"] for result in results] == names
+    assert [result["ok"] for result in results] == [
+        name != "crash" for name in names
+    ]
+    assert "BrokenProcessPool" in results[2]["error"]
@@ -0,0 +1,55 @@
+import os
+
+import numpy as np
+
+from meshing import cache as cache_module
+from meshing.cache import TessellationCache
+
+
+def _arrays(size):
+    vertices = np.arange(size * 3, dtype=np.float64).reshape(-1, 3)
+    return vertices, np.zeros((1, 3), dtype=np.int32)
+
+
+def _disk_bytes(directory):
+    return sum(entry.stat().st_size for entry in os.scandir(directory))
+
+
+def test_disk_round_trip(tmp_path):
+    cache = TessellationCache(cache_dir=str(tmp_path))
+    vertices, faces = _arrays(10)
+    cache.put("key", vertices, faces)
+
+    fresh = TessellationCache(cache_dir=str(tmp_path))
+    loaded_vertices, loaded_faces = fresh.get("key")
+    np.testing.assert_array_equal(loaded_vertices, vertices)
+    np.testing.assert_array_equal(loaded_faces, faces)
+
+
+def test_stores_do_not_rescan_until_over_limit(tmp_path, monkeypatch):
+    scans = []
+    scandir = os.scandir
+
+    def counting_scandir(path):
+        scans.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(cache_module.os, "scandir", counting_scandir)
+    cache = TessellationCache(cache_dir=str(tmp_path), max_disk_bytes=1 << 30)
+    for index in range(50):
+        cache.put(f"key{index}", *_arrays(10))
+    assert len(scans) == 1
+
+
+def test_evicts_least_recently_used_over_limit(tmp_path):
+    cache = TessellationCache(cache_dir=str(tmp_path), max_entries=0)
+    cache.put("key0", *_arrays(100))
+    cache.max_disk_bytes = 3 * _disk_bytes(tmp_path)
+    for index in range(5):
+        if index:
+            cache.put(f"key{index}", *_arrays(100))
+        # Distinct mtimes, oldest first, however fast the writes are.
+        os.utime(tmp_path / f"key{index}.npz", (index, index))
+
+    assert _disk_bytes(tmp_path) <= cache.max_disk_bytes
+    assert sorted(os.listdir(tmp_path)) == ["key2.npz", "key3.npz", "key4.npz"]
@@ -0,0 +1,163 @@
+import json
+import struct
+import xml.etree.ElementTree as ElementTree
+import zipfile
+
+import numpy as np
+import pytest
+import trimesh
+
+from exporters import GLBExporter, PLYExporter, ThreeMFExporter
+from exporters.quantization import quantize_positions
+
+PLY_TYPES = {"uchar": "u1", "ushort": "<u2", "uint": "<u4"}
+GLB_TYPES = {5121: "u1", 5123: "<u2", 5125: "<u4", 5126: "<f4"}
+THREEMF_NAMESPACE = "{http://schemas.microsoft.com/3dmanufacturing/core/2015/02}"
+
+
+def _mesh(subdivisions=3):
+    mesh = trimesh.creation.icosphere(subdivisions=subdivisions, radius=37.0)
+    rng = np.random.default_rng(0)
+    vertices = mesh.vertices + rng.normal(scale=0.3, size=mesh.vertices.shape)
+    return vertices + (1000.0, -5.0, 3.0), np.asarray(mesh.faces)
+
+
+def read_ply(path):
+    data = path.read_bytes()
+    end = data.index(b"end_header\n") + len(b"end_header\n")
+    header = [line.split() for line in data[:end].decode("ascii").splitlines()]
+    counts = {line[1]: int(line[2]) for line in header if line[0] == "element"}
+    index_type = next(line[3] for line in header if line[:2] == ["property", "list"])
+    vertices = np.frombuffer(data, "<f4", counts["vertex"] * 3, end)
+    records = np.frombuffer(
+        data,
+        [("count", "u1"), ("indices", PLY_TYPES[index_type], (3,))],
+        counts["face"],
+        end + vertices.nbytes,
+    )
+    assert (records["count"] == 3).all()
+    return vertices.reshape(-1, 3).astype(np.float64), records["indices"], index_type
+
+
+def read_glb(path):
+    data = path.read_bytes()
+    assert struct.unpack_from("<III", data) == (0x46546C67, 2, len(data))
+    json_length = struct.unpack_from("<I", data, 12)[0]
+    document = json.loads(data[20 : 20 + json_length])
+    binary = data[28 + json_length :]
+
+    def accessor(index):
+        info = document["accessors"][index]
+        view = document["bufferViews"][info["bufferView"]]
+        dtype = np.dtype(GLB_TYPES[info["componentType"]])
+        width = 3 if info["type"] == "VEC3" else 1
+        stride = view.get("byteStride", dtype.itemsize * width) // dtype.itemsize
+        values = np.frombuffer(
+            binary, dtype, info["count"] * stride, view["byteOffset"]
+        )
+        return values.reshape(info["count"], stride)[:, :width]
+
+    primitive = document["meshes"][0]["primitives"][0]
+    node = document["nodes"][0]
+    vertices = accessor(primitive["attributes"]["POSITION"]).astype(np.float64)
+    vertices = vertices * node.get("scale", 1.0) + node.get("translation", 0.0)
+    indices = accessor(primitive["indices"]).reshape(-1, 3)
+    return vertices, indices, document
+
+
+def read_3mf(path):
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("3D/3dmodel.model"))
+    vertices = [
+        [float(vertex.get(axis)) for axis in "xyz"]
+        for vertex in root.iter(f"{THREEMF_NAMESPACE}vertex")
+    ]
+    faces = [
+        [int(triangle.get(key)) for key in ("v1", "v2", "v3")]
+        for triangle in root.iter(f"{THREEMF_NAMESPACE}triangle")
+    ]
+    return np.array(vertices), np.array(faces)
+
+
+def _float32_error(vertices):
+    # One float32 rounding of each coordinate.
+    return np.abs(vertices).max() * np.finfo(np.float32).eps
+
+
+@pytest.mark.parametrize("compact_indices", [True, False])
+def test_ply_round_trip(tmp_path, compact_indices):
+    vertices, faces = _mesh()
+    path = tmp_path / "mesh.ply"
+    PLYExporter(compact_indices=compact_indices).write(vertices, faces, str(path))
+
+    read_vertices, read_faces, index_type = read_ply(path)
+
+    assert index_type == ("ushort" if compact_indices else "uint")
+    np.testing.assert_array_equal(read_faces, faces)
+    assert np.abs(read_vertices - vertices).max() <= _float32_error(vertices)
+    # Other readers agree.
+    loaded = trimesh.load(str(path), process=False)
+    np.testing.assert_array_equal(loaded.faces, faces)
+
+
+def test_glb_round_trip(tmp_path):
+    vertices, faces = _mesh()
+    path = tmp_path / "mesh.glb"
+    GLBExporter().write(vertices, faces, str(path))
+
+    read_vertices, read_faces, document = read_glb(path)
+
+    assert "extensionsUsed" not in document
+    np.testing.assert_array_equal(read_faces, faces)
+    assert np.abs(read_vertices - vertices).max() <= _float32_error(vertices)
+    loaded = trimesh.load(str(path), force="mesh", process=False)
+    np.testing.assert_array_equal(loaded.faces, faces)
+
+
+@pytest.mark.parametrize("bits", [8, 12, 16])
+def test_quantized_glb_error_is_half_a_step(tmp_path, bits):
+    vertices, faces = _mesh()
+    path = tmp_path / "mesh.glb"
+    GLBExporter(position_bits=bits).write(vertices, faces, str(path))
+    step = quantize_positions(vertices, bits)[2]
+
+    read_vertices, read_faces, document = read_glb(path)
+
+    assert document["extensionsRequired"] == ["KHR_mesh_quantization"]
+    np.testing.assert_array_equal(read_faces, faces)
+    error = np.abs(read_vertices - vertices).max()
+    assert error <= step / 2 * (1 + 1e-9)
+
+
+def test_glb_narrow_indices(tmp_path):
+    vertices, faces = _mesh(subdivisions=1)
+    path = tmp_path / "mesh.glb"
+    GLBExporter().write(vertices, faces, str(path))
+    _, read_faces, document = read_glb(path)
+    assert document["accessors"][1]["componentType"] == 5121
+    np.testing.assert_array_equal(read_faces, faces)
+
+
+def test_3mf_round_trip(tmp_path):
+    vertices, faces = _mesh()
+    path = tmp_path / "mesh.3mf"
+    ThreeMFExporter().write(vertices, faces, str(path))
+
+    read_vertices, read_faces = read_3mf(path)
+
+    np.testing.assert_array_equal(read_faces, faces)
+    # "%.9g" keeps float32 precision.
+    assert np.abs(read_vertices - vertices).max() <= _float32_error(vertices)
+
+
+@pytest.mark.parametrize("decimals", [0, 2, 4])
+def test_3mf_decimals_error(tmp_path, decimals):
+    vertices, faces = _mesh()
+    path = tmp_path / "mesh.3mf"
+    ThreeMFExporter(decimals=decimals).write(vertices, faces, str(path))
+
+    read_vertices, read_faces = read_3mf(path)
+
+    np.testing.assert_array_equal(read_faces, faces)
+    error = np.abs(read_vertices - vertices).max()
+    assert error <= 0.5 * 10.0**-decimals * (1 + 1e-9)
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from objects import OrganicObject
+from strategies.organic_model import base_icosphere, build_organic_meshes
+
+
+@pytest.mark.parametrize("high_resolution", [False, True])
+def test_meshes_own_writable_faces(high_resolution):
+    parameters = {"subdivisions": 2, "seed": 1, "high_resolution": high_resolution}
+    first, second = build_organic_meshes([dict(parameters), dict(parameters)])
+    _, shared = base_icosphere(2, high_resolution)
+
+    first.faces[0] = first.faces[0][::-1]
+
+    assert not np.shares_memory(first.faces, second.faces)
+    np.testing.assert_array_equal(second.faces, shared)
+
+
+def test_get_mesh_faces_are_writable():
+    obj = OrganicObject({"subdivisions": 2, "seed": 3})
+    mesh = obj.get_mesh()
+    original = mesh.faces.copy()
+    mesh.faces[0] = original[0][::-1]
+    np.testing.assert_array_equal(mesh.faces[0], original[0][::-1])
+
+    obj.translate((1, 0, 0))
+    placed = obj.get_mesh()
+    assert not np.shares_memory(placed.faces, obj.mesh.faces)
+    placed.faces[1] = original[1][::-1]
+    np.testing.assert_array_equal(placed.faces[1], original[1][::-1])
+    np.testing.assert_array_equal(obj.mesh.faces[1], original[1])
+
+
+def test_batched_matches_single_build():
+    parameter_list = [{"subdivisions": 3, "seed": seed} for seed in range(4)]
+    batched = OrganicObject.build_many(parameter_list)
+    for obj, parameters in zip(batched, parameter_list):
+        single = OrganicObject(dict(parameters)).get_mesh()
+        np.testing.assert_array_equal(obj.get_mesh().vertices, single.vertices)
+        np.testing.assert_array_equal(obj.get_mesh().faces, single.faces)
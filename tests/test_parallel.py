@@ -0,0 +1,57 @@
+import os
+import time
+
+import pytest
+
+from meshing.parallel import (
+    IN_FLIGHT_PER_WORKER,
+    iter_meshes_parallel,
+    mesh_objects_parallel,
+)
+from objects.primitives import Cube, Sphere
+
+pytestmark = pytest.mark.skipif(
+    not os.path.isdir("/dev/shm"), reason="needs /dev/shm to count blocks"
+)
+
+
+def _shared_blocks():
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+
+def _spheres(count):
+    return [Sphere({"radius": 5 + index * 0.01}) for index in range(count)]
+
+
+def test_meshes_in_order():
+    objects = _spheres(6)
+    meshes = mesh_objects_parallel(objects, max_workers=2)
+    for obj, mesh in zip(objects, meshes):
+        assert mesh.extents.max() == pytest.approx(2 * obj.parameters["radius"])
+
+
+def test_failure_unlinks_finished_blocks():
+    before = _shared_blocks()
+    objects = _spheres(20) + [Cube({"length": 0})]
+    with pytest.raises(Exception):
+        list(iter_meshes_parallel(objects, max_workers=4))
+    assert _shared_blocks() <= before
+
+
+def test_early_exit_unlinks_finished_blocks():
+    before = _shared_blocks()
+    meshes = iter_meshes_parallel(_spheres(20), max_workers=4)
+    next(meshes)
+    meshes.close()
+    assert _shared_blocks() <= before
+
+
+def test_bounded_in_flight_results():
+    before = _shared_blocks()
+    meshes = iter_meshes_parallel(_spheres(64), max_workers=2)
+    next(meshes)
+    time.sleep(1.0)
+    # Two blocks (vertices, faces) per result waiting in shared memory.
+    window = IN_FLIGHT_PER_WORKER * 2
+    assert len(_shared_blocks() - before) <= 2 * window
+    meshes.close()
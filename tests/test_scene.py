@@ -0,0 +1,83 @@
+import pytest
+
+from instrumentation import Recorder
+from objects.primitives import Cube, Cylinder, Pyramid, Sphere
+from scene import Scene
+
+
+def _scene(budget, backend=None):
+    scene = Scene(triangle_budget=budget, mesh_backend=backend)
+    for index in range(3):
+        scene.add(Sphere({"radius": 3 + index}))
+        scene.add(Cylinder({"radius": 1 + index, "height": 10}))
+        scene.add(Cube())
+        scene.add(Pyramid())
+    return scene
+
+
+@pytest.mark.parametrize("backend", [None, "analytic"])
+@pytest.mark.parametrize("budget", [2_000, 20_000, 60_000])
+def test_triangle_budget_is_a_maximum(tmp_path, backend, budget):
+    scene = _scene(budget, backend)
+    stats = scene.export_stl(str(tmp_path / "scene.stl"), recorder=Recorder())
+
+    assert stats.triangles <= budget
+    # The budget is spent, not just respected.
+    assert stats.triangles >= 0.5 * budget
+
+
+def _placed_after_build(obj, offset):
+    obj.build()
+    obj.model = obj.model.translate(offset)
+    return obj
+
+
+@pytest.mark.parametrize("backend", [None, "analytic"])
+@pytest.mark.parametrize("budget", [3_000, 20_000])
+def test_triangle_budget_counts_placed_models(tmp_path, backend, budget):
+    scene = Scene(triangle_budget=budget, mesh_backend=backend)
+    for index in range(3):
+        scene.add(_placed_after_build(Sphere({"radius": 3}), (10 * index, 0, 0)))
+        scene.add(
+            _placed_after_build(
+                Cylinder({"radius": 2, "height": 8}), (10 * index, 10, 0)
+            )
+        )
+    scene.add(Sphere({"radius": 3}).translate((0, -10, 0)))
+    assert all(obj.estimate_triangles(1.0) is None for obj in scene.objects[:-1])
+
+    stats = scene.export_stl(str(tmp_path / "scene.stl"), recorder=Recorder())
+
+    assert stats.triangles <= budget
+    assert stats.triangles >= 0.5 * budget
+
+
+def _stats_scene():
+    scene = Scene(mesh_backend="analytic")
+    for index in range(4):
+        scene.add(Sphere({"radius": 2}).translate((10 * index, 0, 0)))
+    scene.add(Cube().translate((0, 20, 0)))
+    return scene
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"parallel": True, "max_workers": 2},
+        {"instancing": True},
+        {"instancing": True, "parallel": True, "max_workers": 2},
+        {"fused": True},
+    ],
+    ids=["serial", "parallel", "instancing", "parallel_instancing", "fused"],
+)
+def test_per_object_triangles(tmp_path, options):
+    scene = _stats_scene()
+    stats = scene.export_stl(
+        str(tmp_path / "scene.stl"), recorder=Recorder(), **options
+    )
+
+    objects = stats.as_dict()["objects"]
+    assert len(objects) == len(scene.objects)
+    assert all(entry["triangles"] > 0 for entry in objects)
+    assert sum(entry["triangles"] for entry in objects) == stats.triangles
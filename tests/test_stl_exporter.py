@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+import pytest
+import trimesh
+
+from exporters.stl_exporter import STLExporter, STLStreamWriter
+
+
+def _sphere():
+    return trimesh.creation.icosphere(subdivisions=2)
+
+
+def test_stream_matches_combined_export(tmp_path):
+    meshes = [_sphere(), _sphere().apply_translation((3, 0, 0))]
+    path = tmp_path / "scene.stl"
+
+    count = STLExporter().export_stream(meshes, str(path))
+
+    loaded = trimesh.load(str(path))
+    assert count == sum(len(mesh.faces) for mesh in meshes) == len(loaded.faces)
+    np.testing.assert_allclose(
+        loaded.bounds, trimesh.util.concatenate(meshes).bounds, atol=1e-6
+    )
+    assert os.listdir(tmp_path) == ["scene.stl"]
+
+
+def test_failed_stream_keeps_previous_file(tmp_path):
+    path = tmp_path / "scene.stl"
+    STLExporter().export_stream([_sphere()], str(path))
+    previous = path.read_bytes()
+
+    def failing():
+        yield _sphere()
+        raise RuntimeError("meshing failed")
+
+    with pytest.raises(RuntimeError):
+        STLExporter().export_stream(failing(), str(path))
+
+    assert path.read_bytes() == previous
+    assert os.listdir(tmp_path) == ["scene.stl"]
+
+
+def test_abort_leaves_no_file(tmp_path):
+    path = tmp_path / "scene.stl"
+    writer = STLStreamWriter(str(path))
+    writer.write_mesh(_sphere())
+    writer.abort()
+    writer.close()
+    assert not os.listdir(tmp_path)
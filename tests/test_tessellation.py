@@ -0,0 +1,63 @@
+import cadquery as cq
+import numpy as np
+import pytest
+
+from meshing.tessellation import tessellate_shape
+
+
+def _reference(shape, tolerance, angular_tolerance):
+    vertices, triangles = shape.tessellate(tolerance, angular_tolerance)
+    return (
+        np.array([vertex.toTuple() for vertex in vertices], dtype=np.float64),
+        np.array(triangles, dtype=np.int32).reshape(-1, 3),
+    )
+
+
+SHAPES = {
+    "box": lambda: cq.Workplane("XY").box(10, 20, 30),
+    "sphere": lambda: cq.Workplane("XY").sphere(5),
+    "moved_cylinder": lambda: cq.Workplane("XY")
+    .cylinder(10, 3)
+    .translate((4, -2, 7))
+    .rotate((0, 0, 0), (1, 1, 0), 30),
+    "loft": lambda: cq.Workplane("XY")
+    .rect(10, 10)
+    .workplane(offset=15)
+    .circle(3)
+    .loft(combine=True),
+    "boolean": lambda: cq.Workplane("XY")
+    .box(10, 10, 10)
+    .cut(cq.Workplane("XY").sphere(6)),
+}
+
+
+@pytest.mark.parametrize("name", sorted(SHAPES))
+@pytest.mark.parametrize("tolerances", [(0.1, 0.1), (0.01, 0.05)])
+def test_matches_shape_tessellate(name, tolerances):
+    shape = SHAPES[name]().val()
+    expected_vertices, expected_faces = _reference(shape, *tolerances)
+
+    vertices, faces = tessellate_shape(shape, *tolerances)
+
+    assert vertices.dtype == np.float64 and vertices.flags["C_CONTIGUOUS"]
+    assert faces.dtype == np.int32 and faces.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(faces, expected_faces)
+    np.testing.assert_allclose(vertices, expected_vertices, rtol=0, atol=1e-12)
+
+
+def test_accepts_workplane():
+    workplane = SHAPES["box"]()
+    vertices, faces = tessellate_shape(workplane, 0.1)
+    expected_vertices, expected_faces = _reference(workplane.val(), 0.1, 0.1)
+    np.testing.assert_array_equal(faces, expected_faces)
+    np.testing.assert_allclose(vertices, expected_vertices, rtol=0, atol=1e-12)
+
+
+def test_coarser_tolerance_after_finer_mesh():
+    shape = SHAPES["sphere"]().val()
+    fine_vertices, _ = tessellate_shape(shape, 0.01, 0.05)
+    coarse_vertices, coarse_faces = tessellate_shape(shape, 0.5, 0.5)
+    expected_vertices, expected_faces = _reference(SHAPES["sphere"]().val(), 0.5, 0.5)
+    assert len(coarse_vertices) < len(fine_vertices)
+    np.testing.assert_array_equal(coarse_faces, expected_faces)
+    np.testing.assert_allclose(coarse_vertices, expected_vertices, atol=1e-12)
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from meshing.transforms import rotation_matrix, scale_matrix, translation_matrix
+from objects.primitives import Cube
+
+
+def test_transform_stack_places_mesh():
+    cube = Cube(backend="analytic")
+    cube.scale((1, 2, 3)).rotate((0, 0, 1), 90).translate((5, 0, 0))
+    mesh = cube.get_mesh()
+    np.testing.assert_allclose(mesh.bounds, [[-5, -5, -15], [15, 5, 15]], atol=1e-9)
+    assert mesh.volume == pytest.approx(6000)
+
+
+def test_accepts_proper_matrix():
+    matrix = translation_matrix((1, 2, 3)) @ rotation_matrix((1, 1, 0), 30)
+    cube = Cube(backend="analytic").apply_transform(matrix)
+    np.testing.assert_array_equal(cube.transform, matrix)
+
+
+@pytest.mark.parametrize(
+    "matrix",
+    [
+        np.diag([-1.0, 1.0, 1.0, 1.0]),
+        np.diag([1.0, 1.0, 0.0, 1.0]),
+        np.eye(3),
+    ],
+    ids=["reflection", "singular", "not_4x4"],
+)
+def test_rejects_winding_flips(matrix):
+    cube = Cube(backend="analytic")
+    with pytest.raises(ValueError):
+        cube.apply_transform(matrix)
+    np.testing.assert_array_equal(cube.transform, np.eye(4))
+
+
+def test_scale_rejects_flips():
+    with pytest.raises(ValueError):
+        scale_matrix((1, -1, 1))
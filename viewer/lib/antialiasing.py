@@ -0,0 +1,177 @@
+# pylint: disable=no-name-in-module,import-error,missing-module-docstring
+
+import math
+from typing import Tuple
+
+import numpy as np
+from vispy import gloo, scene
+
+MAX_SUPERSAMPLE = 4
+# FXAA: one extra full-screen pass, where supersampling shades and stores
+# scale**2 times the pixels every frame.
+DEFAULT_SAMPLES = 2
+MAX_TARGET_SIZE = 8192
+
+RESOLVE_VERTEX = """
+attribute vec2 a_position;
+void main() {
+    gl_Position = vec4(a_position, 0.0, 1.0);
+}
+"""
+
+# Averages u_scale x u_scale texels per pixel (supersampling), or applies
+# a simple FXAA edge filter when rendering at u_scale == 1.
+RESOLVE_FRAGMENT = """
+uniform sampler2D u_texture;
+uniform vec2 u_texture_size;
+uniform int u_scale;
+uniform float u_fxaa;
+
+const int MAX_SCALE = %d;
+const vec3 LUMA = vec3(0.299, 0.587, 0.114);
+
+vec4 fetch(vec2 texel) {
+    return texture2D(u_texture, texel / u_texture_size);
+}
+
+vec4 fxaa(vec2 center) {
+    vec4 color = fetch(center);
+    float luma_nw = dot(fetch(center + vec2(-1.0, -1.0)).rgb, LUMA);
+    float luma_ne = dot(fetch(center + vec2(1.0, -1.0)).rgb, LUMA);
+    float luma_sw = dot(fetch(center + vec2(-1.0, 1.0)).rgb, LUMA);
+    float luma_se = dot(fetch(center + vec2(1.0, 1.0)).rgb, LUMA);
+    float luma_m = dot(color.rgb, LUMA);
+    float luma_min = min(luma_m, min(min(luma_nw, luma_ne), min(luma_sw, luma_se)));
+    float luma_max = max(luma_m, max(max(luma_nw, luma_ne), max(luma_sw, luma_se)));
+    vec2 dir = vec2(
+        -((luma_nw + luma_ne) - (luma_sw + luma_se)),
+        (luma_nw + luma_sw) - (luma_ne + luma_se)
+    );
+    float reduce = max(
+        (luma_nw + luma_ne + luma_sw + luma_se) * (0.25 / 8.0), 1.0 / 128.0
+    );
+    float scale = 1.0 / (min(abs(dir.x), abs(dir.y)) + reduce);
+    dir = clamp(dir * scale, vec2(-8.0), vec2(8.0));
+    vec3 rgb_a = 0.5 * (
+        fetch(center + dir * (1.0 / 3.0 - 0.5)).rgb
+        + fetch(center + dir * (2.0 / 3.0 - 0.5)).rgb
+    );
+    vec3 rgb_b = rgb_a * 0.5 + 0.25 * (
+        fetch(center - dir * 0.5).rgb + fetch(center + dir * 0.5).rgb
+    );
+    float luma_b = dot(rgb_b, LUMA);
+    if (luma_b < luma_min || luma_b > luma_max) {
+        return vec4(rgb_a, color.a);
+    }
+    return vec4(rgb_b, color.a);
+}
+
+void main() {
+    if (u_fxaa > 0.5) {
+        gl_FragColor = fxaa(gl_FragCoord.xy);
+        return;
+    }
+    vec2 origin = (gl_FragCoord.xy - 0.5) * float(u_scale);
+    vec4 total = vec4(0.0);
+    for (int i = 0; i < MAX_SCALE; i++) {
+        if (i >= u_scale) break;
+        for (int j = 0; j < MAX_SCALE; j++) {
+            if (j >= u_scale) break;
+            total += fetch(origin + vec2(float(i), float(j)) + 0.5);
+        }
+    }
+    gl_FragColor = total / float(u_scale * u_scale);
+}
+""" % MAX_SUPERSAMPLE
+
+
+def antialiasing_mode(samples: int) -> Tuple[int, bool]:
+    """
+    ``(supersample factor, fxaa)`` approximating ``samples`` per pixel:
+    0 is off, 1-3 use FXAA, and 4 or more render at ``sqrt(samples)``
+    times the resolution (up to ``MAX_SUPERSAMPLE``) and average down.
+    """
+    if samples <= 0:
+        return 1, False
+    if samples < 4:
+        return 1, True
+    return min(MAX_SUPERSAMPLE, int(math.sqrt(samples))), False
+
+
+class AntialiasedSceneCanvas(scene.SceneCanvas):
+    """
+    SceneCanvas that antialiases in its own offscreen framebuffer.
+
+    MSAA sample counts are fixed when the GL context is created, so
+    changing them meant a new canvas and re-uploading every visual. Here
+    the scene is drawn into an offscreen colour texture (larger than the
+    window when supersampling) and resolved to the screen by a
+    full-screen pass, so ``samples`` can change at any time; only the two
+    offscreen targets are resized.
+    """
+
+    def __init__(self, *args, samples: int = 0, **kwargs):
+        self._samples = samples
+        self._targets = None
+        self._resolve = None
+        self._offscreen = False
+        super().__init__(*args, **kwargs)
+
+    @property
+    def samples(self) -> int:
+        return self._samples
+
+    @samples.setter
+    def samples(self, samples: int):
+        self._samples = samples
+        self.update()
+
+    def render(self, *args, **kwargs):
+        # Offscreen renders (screenshots) already draw into their own
+        # framebuffer at the requested size.
+        self._offscreen = True
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            self._offscreen = False
+
+    def _draw_scene(self, bgcolor=None):
+        scale, fxaa = antialiasing_mode(self._samples)
+        if self._offscreen or (scale == 1 and not fxaa):
+            super()._draw_scene(bgcolor=bgcolor)
+            return
+        width, height = self.physical_size
+        scale = max(1, min(scale, MAX_TARGET_SIZE // max(width, height, 1)))
+        color, framebuffer = self._offscreen_targets((height * scale, width * scale))
+        self.push_fbo(framebuffer, (0, 0), self.size)
+        try:
+            super()._draw_scene(bgcolor=bgcolor)
+        finally:
+            self.pop_fbo()
+        resolve = self._resolve_program()
+        resolve["u_texture"] = color
+        resolve["u_texture_size"] = (width * scale, height * scale)
+        resolve["u_scale"] = scale
+        resolve["u_fxaa"] = 1.0 if fxaa else 0.0
+        gloo.set_viewport(0, 0, width, height)
+        gloo.set_state(depth_test=False, blend=False, cull_face=False)
+        resolve.draw("triangle_strip")
+
+    def _offscreen_targets(self, shape: Tuple[int, int]):
+        if self._targets is None:
+            color = gloo.Texture2D(shape=shape + (4,), interpolation="linear")
+            depth = gloo.RenderBuffer(shape, format="depth")
+            self._targets = (color, depth, gloo.FrameBuffer(color, depth))
+        color, depth, framebuffer = self._targets
+        if color.shape[:2] != shape:
+            color.resize(shape + (4,))
+            depth.resize(shape)
+        return color, framebuffer
+
+    def _resolve_program(self) -> gloo.Program:
+        if self._resolve is None:
+            self._resolve = gloo.Program(RESOLVE_VERTEX, RESOLVE_FRAGMENT)
+            self._resolve["a_position"] = np.array(
+                [[-1, -1], [1, -1], [-1, 1], [1, 1]], dtype=np.float32
+            )
+        return self._resolve
@@ -9,3 +9,6 @@ class ViewerConfig(BaseModel):
     window_width: int = 800
     window_height: int = 600
     fov: float = 45.0
+    watch: bool = False
+    outline_angle: float = 30.0
+    frame_log: bool = False
@@ -0,0 +1,80 @@
+# pylint: disable=missing-module-docstring
+
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+FRAME_WINDOW = 240
+# Longer gaps mean the viewer was idle, not that a frame was slow.
+CONTINUOUS_FRAME_GAP = 0.25
+
+
+class FrameStats:
+    """
+    Rolling frame timings for the viewer's frame-time overlay.
+
+    ``begin_frame``/``end_frame`` bracket each draw. Frame times are the
+    intervals between consecutive frames while rendering continuously
+    (autopan, dragging); draw times are the CPU time spent issuing each
+    frame. Uploads are counted by the window as it sends geometry.
+    """
+
+    def __init__(self, window: int = FRAME_WINDOW) -> None:
+        self.frame_times: deque = deque(maxlen=window)
+        self.draw_times: deque = deque(maxlen=window)
+        self.frame_starts: deque = deque(maxlen=window)
+        self.triangles = 0
+        self.upload_bytes = 0
+        self._draw_start: Optional[float] = None
+
+    def begin_frame(self) -> None:
+        now = time.perf_counter()
+        if self.frame_starts and now - self.frame_starts[-1] < CONTINUOUS_FRAME_GAP:
+            self.frame_times.append(now - self.frame_starts[-1])
+        self.frame_starts.append(now)
+        self._draw_start = now
+
+    def end_frame(self) -> None:
+        if self._draw_start is not None:
+            self.draw_times.append(time.perf_counter() - self._draw_start)
+            self._draw_start = None
+
+    def count_upload(self, nbytes: int) -> None:
+        self.upload_bytes += nbytes
+
+    def fps(self) -> float:
+        now = time.perf_counter()
+        return float(sum(1 for start in self.frame_starts if now - start <= 1.0))
+
+    def summary(self) -> Dict[str, Any]:
+        frame_ms = np.array(self.frame_times) * 1000.0
+        draw_ms = np.array(self.draw_times) * 1000.0
+        if len(frame_ms):
+            p50, p95, p99 = np.percentile(frame_ms, [50, 95, 99])
+        else:
+            p50 = p95 = p99 = None
+        return {
+            "fps": self.fps(),
+            "frame_ms_p50": p50,
+            "frame_ms_p95": p95,
+            "frame_ms_p99": p99,
+            "draw_ms_p50": float(np.median(draw_ms)) if len(draw_ms) else None,
+            "triangles": self.triangles,
+            "upload_bytes": self.upload_bytes,
+        }
+
+    def format(self) -> str:
+        summary = self.summary()
+
+        def ms(value: Optional[float]) -> str:
+            return "-" if value is None else f"{value:.1f}"
+
+        return (
+            f"{summary['fps']:.0f} fps | frame ms p50 {ms(summary['frame_ms_p50'])}"
+            f" p95 {ms(summary['frame_ms_p95'])} p99 {ms(summary['frame_ms_p99'])}"
+            f" | draw ms {ms(summary['draw_ms_p50'])}"
+            f" | {summary['triangles']:,} triangles"
+            f" | uploaded {summary['upload_bytes'] / 1e6:.1f} MB"
+        )
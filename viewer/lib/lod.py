@@ -0,0 +1,153 @@
+# pylint: disable=missing-module-docstring
+
+from typing import List, Sequence
+
+import numpy as np
+
+from .mesh_loader import ViewerMesh
+
+LOD_FACTORS = (4, 16, 64)
+LOD_MIN_TRIANGLES = 200_000
+QUADRIC_CHUNK_FACES = 1 << 20
+CELL_AXIS_BITS = 21
+SINGULAR_THRESHOLD = 1e-3
+
+
+def _cell_ids(vertices: np.ndarray, origin: np.ndarray, size: float):
+    """
+    Compact cell index of every vertex and the integer corner of each cell.
+    """
+    cells = np.floor((vertices - origin) / size).astype(np.int64)
+    keys = (
+        cells[:, 0] << (2 * CELL_AXIS_BITS)
+        | cells[:, 1] << CELL_AXIS_BITS
+        | cells[:, 2]
+    )
+    unique, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    return inverse.ravel(), cells[first], len(unique)
+
+
+def _cluster_quadrics(vertices, faces, vertex_cells, cell_count):
+    """
+    Sum the area-weighted plane quadrics of the faces around each cell.
+
+    Returns ``(A, b, centroid)`` with ``A`` of shape ``(m, 3, 3)`` such that
+    the point minimizing the summed squared plane distances solves
+    ``A x = b``.
+    """
+    upper = [(0, 0), (0, 1), (0, 2), (1, 1), (1, 2), (2, 2)]
+    normal_sums = np.zeros((6, cell_count))
+    offset_sums = np.zeros((3, cell_count))
+    for start in range(0, len(faces), QUADRIC_CHUNK_FACES):
+        chunk = faces[start : start + QUADRIC_CHUNK_FACES]
+        triangles = vertices[chunk].astype(np.float64)
+        cross = np.cross(
+            triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+        )
+        length = np.linalg.norm(cross, axis=1)
+        keep = length > 0
+        cross, length, triangles = cross[keep], length[keep], triangles[keep]
+        # cross = 2 * area * unit normal, so cross cross^T / |cross| is the
+        # unit-normal quadric weighted by twice the face area.
+        distance = -np.einsum("ij,ij->i", cross, triangles[:, 0]) / length
+        corners = vertex_cells[chunk[keep]].ravel()
+        for row, (i, j) in enumerate(upper):
+            weights = np.repeat(cross[:, i] * cross[:, j] / length, 3)
+            normal_sums[row] += np.bincount(corners, weights, cell_count)
+        for i in range(3):
+            weights = np.repeat(-distance * cross[:, i], 3)
+            offset_sums[i] += np.bincount(corners, weights, cell_count)
+    quadric = np.empty((cell_count, 3, 3))
+    for row, (i, j) in enumerate(upper):
+        quadric[:, i, j] = quadric[:, j, i] = normal_sums[row]
+    counts = np.bincount(vertex_cells, minlength=cell_count)
+    centroid = np.stack(
+        [np.bincount(vertex_cells, vertices[:, i], cell_count) for i in range(3)],
+        axis=1,
+    ) / np.maximum(counts, 1)[:, None]
+    return quadric, offset_sums.T, centroid
+
+
+def _solve_cells(quadric, rhs, centroid):
+    """
+    Minimize each cell's quadric, starting from the vertex centroid and
+    ignoring directions the quadric barely constrains (flat or straight
+    regions), via a truncated pseudo-inverse.
+    """
+    u, singular, vt = np.linalg.svd(quadric)
+    limit = singular[:, :1] * SINGULAR_THRESHOLD
+    inverse = np.where(singular > limit, 1.0 / np.where(singular > 0, singular, 1), 0)
+    residual = rhs - np.einsum("mij,mj->mi", quadric, centroid)
+    step = np.einsum(
+        "mji,mj,mkj,mk->mi", vt, inverse, u, residual, optimize=True
+    )
+    return centroid + step
+
+
+def decimate(mesh: ViewerMesh, target_triangles: int) -> ViewerMesh:
+    """
+    Simplify ``mesh`` to roughly ``target_triangles`` by quadric vertex
+    clustering.
+
+    Vertices are bucketed in a uniform grid, each occupied cell is replaced
+    by the point minimizing the summed squared distances to the planes of
+    its faces (clamped to the cell), and faces that collapse are dropped.
+    Every step is a vectorized pass over the arrays, and unwelded triangle
+    soups (e.g. mapped STL) are welded by the clustering itself.
+    """
+    vertices, faces = mesh.vertices, mesh.faces.astype(np.int64)
+    origin = mesh.bounds[0]
+    extent = max(float(mesh.extents.max()), 1e-9)
+    # A closed surface has about two triangles per vertex and its occupied
+    # cells grow with the square of the grid resolution.
+    resolution = max(2.0, np.sqrt(target_triangles / 2.0))
+    for _ in range(3):
+        resolution = min(resolution, (1 << CELL_AXIS_BITS) - 2)
+        size = extent / resolution
+        vertex_cells, corners, cell_count = _cell_ids(vertices, origin, size)
+        ratio = target_triangles / 2.0 / cell_count
+        if 0.8 < ratio < 1.25:
+            break
+        resolution *= np.sqrt(ratio)
+    quadric, rhs, centroid = _cluster_quadrics(
+        vertices, faces, vertex_cells, cell_count
+    )
+    points = _solve_cells(quadric, rhs, centroid)
+    low = origin + corners * size
+    points = np.clip(points, low, low + size)
+    faces = vertex_cells[faces]
+    faces = faces[
+        (faces[:, 0] != faces[:, 1])
+        & (faces[:, 1] != faces[:, 2])
+        & (faces[:, 0] != faces[:, 2])
+    ]
+    # Drop faces repeated after clustering, keeping their first winding.
+    ordered = np.sort(faces, axis=1)
+    keys = (
+        ordered[:, 0] << (2 * CELL_AXIS_BITS)
+        | ordered[:, 1] << CELL_AXIS_BITS
+        | ordered[:, 2]
+    )
+    if cell_count < 1 << CELL_AXIS_BITS:
+        _, first = np.unique(keys, return_index=True)
+        faces = faces[np.sort(first)]
+    return ViewerMesh(points, faces)
+
+
+def build_lods(
+    mesh: ViewerMesh, factors: Sequence[int] = LOD_FACTORS
+) -> List[ViewerMesh]:
+    """
+    Decimated levels of ``mesh``, finest first, each about ``factor`` times
+    smaller. Levels below ``LOD_MIN_TRIANGLES / 4`` triangles are skipped,
+    and meshes already smaller than ``LOD_MIN_TRIANGLES`` get none.
+    """
+    levels: List[ViewerMesh] = []
+    if len(mesh.faces) < LOD_MIN_TRIANGLES:
+        return levels
+    for factor in factors:
+        target = len(mesh.faces) // factor
+        if target < LOD_MIN_TRIANGLES // 4:
+            break
+        levels.append(decimate(mesh, target))
+    return levels
@@ -1,10 +1,175 @@
 # pylint: disable=no-name-in-module,import-error,missing-module-docstring
 
+import os
+from typing import Callable, Optional, Tuple
+
+import numpy as np
 import trimesh
 
+from exporters.stl_exporter import STL_HEADER_SIZE, STL_RECORD_DTYPE
+
+STL_COUNT_SIZE = 4
+BOUNDS_ROW_POINTS = 1024
+PREVIEW_TRIANGLES = 200_000
+LOAD_CHUNK_TRIANGLES = 1 << 20
+
+ProgressCallback = Callable[[float], None]
+
+
+def _reduce_points(function: np.ufunc, points: np.ndarray) -> np.ndarray:
+    """
+    ``function.reduce(points, axis=0)`` for an ``(n, 3)`` array.
+
+    NumPy reduces three-wide rows slowly, so whole blocks of points are
+    first folded into wide rows and reduced, then the partial results and
+    the leftover points are reduced together.
+    """
+    whole = len(points) // BOUNDS_ROW_POINTS * BOUNDS_ROW_POINTS
+    parts = [points[whole:]]
+    if whole:
+        wide = points[:whole].reshape(-1, 3 * BOUNDS_ROW_POINTS)
+        parts.append(function.reduce(wide, axis=0).reshape(-1, 3))
+    return function.reduce(np.concatenate(parts), axis=0)
+
+
+class ViewerMesh:
+    """
+    Vertex and face arrays in the layout uploaded to the GPU.
+
+    Vertices are contiguous float32 and faces uint32, so vispy can upload
+    them without another conversion. Bounds are computed on first use.
+    """
+
+    def __init__(self, vertices: np.ndarray, faces: np.ndarray) -> None:
+        self.vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+        self.faces = np.ascontiguousarray(faces, dtype=np.uint32)
+        self._bounds: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_trimesh(cls, mesh: trimesh.Trimesh) -> "ViewerMesh":
+        return cls(mesh.vertices, mesh.faces)
+
+    @property
+    def bounds(self) -> np.ndarray:
+        if self._bounds is None:
+            if len(self.vertices):
+                self._bounds = np.array(
+                    [
+                        _reduce_points(np.minimum, self.vertices),
+                        _reduce_points(np.maximum, self.vertices),
+                    ],
+                    dtype=np.float64,
+                )
+            else:
+                self._bounds = np.zeros((2, 3))
+        return self._bounds
+
+    @property
+    def extents(self) -> np.ndarray:
+        return self.bounds[1] - self.bounds[0]
+
+    @property
+    def centroid(self) -> np.ndarray:
+        """
+        Centre of the bounding box, used to aim the camera.
+        """
+        return self.bounds.mean(axis=0)
+
+
+def map_binary_stl(file_path: str) -> Optional[np.ndarray]:
+    """
+    Memory-map the triangle records of a binary STL, or return None if the
+    file is not one (e.g. ASCII STL).
+
+    A file is binary when its size matches the triangle count in its
+    header, which an ASCII file starting with ``solid`` practically never
+    does.
+    """
+    size = os.path.getsize(file_path)
+    if size < STL_HEADER_SIZE + STL_COUNT_SIZE:
+        return None
+    with open(file_path, "rb") as handle:
+        handle.seek(STL_HEADER_SIZE)
+        count = int(np.frombuffer(handle.read(STL_COUNT_SIZE), dtype="<u4")[0])
+    if size != STL_HEADER_SIZE + STL_COUNT_SIZE + count * STL_RECORD_DTYPE.itemsize:
+        return None
+    if count == 0:
+        return np.zeros(0, dtype=STL_RECORD_DTYPE)
+    return np.memmap(
+        file_path,
+        dtype=STL_RECORD_DTYPE,
+        mode="r",
+        offset=STL_HEADER_SIZE + STL_COUNT_SIZE,
+        shape=(count,),
+    )
+
+
+def _soup(triangles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    vertices = triangles.reshape(-1, 3)
+    return vertices, np.arange(len(vertices), dtype=np.uint32).reshape(-1, 3)
+
+
+def preview_binary_stl(
+    records: np.ndarray, max_triangles: int = PREVIEW_TRIANGLES
+) -> ViewerMesh:
+    """
+    Coarse preview of mapped STL ``records``: every k-th triangle, so that
+    at most ``max_triangles`` are read and the silhouette is kept.
+    """
+    step = max(1, -(-len(records) // max_triangles))
+    return ViewerMesh(*_soup(np.ascontiguousarray(records["vertices"][::step])))
+
+
+def load_binary_stl(
+    file_path: str, progress: Optional[ProgressCallback] = None
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    ``(vertices, faces)`` of a binary STL read straight from the mapped
+    records, or None if the file is not binary STL.
+
+    The only pass over the data is one strided copy of the records' vertex
+    field into the contiguous float32 upload array, done in chunks so that
+    ``progress`` can be called with the fraction copied; vertices are not
+    merged and faces are simply ``0..3n-1``.
+    """
+    records = map_binary_stl(file_path)
+    if records is None:
+        return None
+    return _copy_records(records, progress)
+
+
+def _copy_records(
+    records: np.ndarray, progress: Optional[ProgressCallback]
+) -> Tuple[np.ndarray, np.ndarray]:
+    if progress is None:
+        return _soup(np.ascontiguousarray(records["vertices"]))
+    triangles = np.empty((len(records), 3, 3), dtype=np.float32)
+    for start in range(0, len(records), LOAD_CHUNK_TRIANGLES):
+        end = min(start + LOAD_CHUNK_TRIANGLES, len(records))
+        triangles[start:end] = records["vertices"][start:end]
+        progress(end / len(records))
+    return _soup(triangles)
+
+
+def load_mesh(
+    file_path: str,
+    progress: Optional[ProgressCallback] = None,
+    preview: Optional[Callable[[ViewerMesh], None]] = None,
+) -> ViewerMesh:
+    """
+    Load ``file_path`` for display.
 
-def load_mesh(file_path: str) -> trimesh.Trimesh:
+    For binary STL ``preview`` is first called with a coarse subset of the
+    triangles and ``progress`` with the fraction loaded as the rest is
+    copied; both are ignored for formats parsed by trimesh.
+    """
+    if file_path.lower().endswith(".stl"):
+        records = map_binary_stl(file_path)
+        if records is not None:
+            if preview is not None and len(records) > PREVIEW_TRIANGLES:
+                preview(preview_binary_stl(records))
+            return ViewerMesh(*_copy_records(records, progress))
     mesh = trimesh.load(file_path)
     if isinstance(mesh, trimesh.Scene):
         mesh = trimesh.util.concatenate(list(mesh.geometry.values()))
-    return mesh
+    return ViewerMesh.from_trimesh(mesh)
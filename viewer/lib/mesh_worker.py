@@ -0,0 +1,90 @@
+# pylint: disable=no-name-in-module,import-error,missing-module-docstring,broad-exception-caught
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from .lod import build_lods
+from .mesh_loader import ViewerMesh, load_mesh
+from .outline import feature_edge_segments
+
+PROGRESS_STEPS = 100
+
+
+class MeshLoadWorker(QThread):
+    """
+    Loads a mesh off the UI thread.
+
+    Emits ``preview`` with a coarse ``ViewerMesh`` as soon as one is
+    available (large binary STL only), ``progress`` in percent while the
+    rest is read, and finally ``loaded`` with the full mesh or ``failed``
+    with an error message. Signals are delivered queued to the UI thread.
+    """
+
+    preview = pyqtSignal(object)
+    progress = pyqtSignal(int)
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, file_path: str, parent=None, with_preview: bool = True):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.with_preview = with_preview
+
+    def run(self):
+        try:
+            mesh = load_mesh(
+                self.file_path,
+                progress=self.report_progress,
+                preview=self.preview.emit if self.with_preview else None,
+            )
+        except Exception as error:
+            self.failed.emit(f"{type(error).__name__}: {error}")
+            return
+        self.loaded.emit(mesh)
+
+    def report_progress(self, fraction: float):
+        self.progress.emit(int(fraction * PROGRESS_STEPS))
+
+
+class LodBuildWorker(QThread):
+    """
+    Builds the decimated levels of detail of a mesh off the UI thread and
+    emits them, finest first, with ``built``.
+    """
+
+    built = pyqtSignal(object)
+
+    def __init__(self, mesh: ViewerMesh, parent=None):
+        super().__init__(parent)
+        self.mesh = mesh
+
+    def run(self):
+        try:
+            levels = build_lods(self.mesh)
+        except Exception:
+            # Levels of detail are an optimisation; keep full resolution.
+            levels = []
+        self.built.emit(levels)
+
+
+class OutlineBuildWorker(QThread):
+    """
+    Extracts the feature-edge outline of a mesh off the UI thread and
+    emits its segment endpoints with ``built``, or ``failed`` with an
+    error message.
+    """
+
+    built = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, mesh: ViewerMesh, angle: float, parent=None):
+        super().__init__(parent)
+        self.mesh = mesh
+        self.angle = angle
+
+    def run(self):
+        try:
+            segments = feature_edge_segments(self.mesh, self.angle)
+        except Exception as error:
+            self.failed.emit(f"{type(error).__name__}: {error}")
+            return
+        self.built.emit(segments)
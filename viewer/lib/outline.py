@@ -0,0 +1,73 @@
+# pylint: disable=missing-module-docstring
+
+from typing import Dict
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+from meshing.welding import weld_vertices
+from .mesh_loader import ViewerMesh
+
+DEFAULT_FEATURE_ANGLE = 30.0
+WELD_RELATIVE_TOLERANCE = 1e-6
+
+# mesh -> {feature angle: (2 * edges, 3) segment endpoints}
+_cache: "WeakKeyDictionary[ViewerMesh, Dict[float, np.ndarray]]" = (
+    WeakKeyDictionary()
+)
+
+
+def feature_edges(
+    vertices: np.ndarray, faces: np.ndarray, angle: float = DEFAULT_FEATURE_ANGLE
+) -> np.ndarray:
+    """
+    Vertex index pairs of the edges worth outlining: boundary and
+    non-manifold edges, and edges whose two faces meet at a dihedral angle
+    above ``angle`` degrees.
+
+    Every face contributes three edges keyed as ``low * n + high``; one
+    sort groups the copies of each edge, so the faces on either side are
+    found without any per-edge Python work.
+    """
+    faces = np.asarray(faces, dtype=np.int64)
+    if len(faces) == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    triangles = np.asarray(vertices, dtype=np.float64)[faces]
+    normals = np.cross(
+        triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+    )
+    lengths = np.linalg.norm(normals, axis=1)
+    normals /= np.where(lengths > 0, lengths, 1.0)[:, None]
+    edges = np.sort(faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    keys = edges[:, 0] * len(vertices) + edges[:, 1]
+    order = np.argsort(keys)
+    keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    counts = np.diff(np.r_[starts, len(keys)])
+    # Interior manifold edges: compare the normals of their two faces.
+    paired = starts[counts == 2]
+    first_face = order[paired] // 3
+    second_face = order[paired + 1] // 3
+    cosines = np.einsum("ij,ij->i", normals[first_face], normals[second_face])
+    sharp = paired[cosines < np.cos(np.radians(angle))]
+    keep = np.concatenate([starts[counts != 2], sharp])
+    return edges[order[np.sort(keep)]]
+
+
+def feature_edge_segments(
+    mesh: ViewerMesh, angle: float = DEFAULT_FEATURE_ANGLE
+) -> np.ndarray:
+    """
+    Endpoints of the feature edges of ``mesh`` as float32 line segments,
+    cached per mesh and angle.
+
+    Vertices are welded first so that unindexed triangle soups (e.g.
+    mapped STL) share their edges.
+    """
+    per_mesh = _cache.setdefault(mesh, {})
+    if angle not in per_mesh:
+        tolerance = max(float(mesh.extents.max()), 1.0) * WELD_RELATIVE_TOLERANCE
+        vertices, faces, _ = weld_vertices(mesh.vertices, mesh.faces, tolerance)
+        edges = feature_edges(vertices, faces, angle)
+        per_mesh[angle] = vertices[edges.ravel()].astype(np.float32)
+    return per_mesh[angle]
@@ -1,3 +1,7 @@
+import os
+import time
+from typing import List, Optional, Tuple
+
 import numpy as np
 from PyQt5.QtWidgets import QInputDialog
 from PyQt5.QtWidgets import (
@@ -8,14 +12,42 @@ from PyQt5.QtWidgets import (
     QMessageBox,
     QColorDialog,
     QMenuBar,
+    QProgressBar,
 )
-from PyQt5.QtGui import QSurfaceFormat
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QFileSystemWatcher, QThread, QTimer
 from vispy import scene, gloo
-from vispy.scene.visuals import XYZAxis, Mesh
-import trimesh
+from vispy.gloo.buffer import DataBuffer
+from vispy.scene.visuals import XYZAxis, Line, Mesh, Text
 import imageio
+from .antialiasing import DEFAULT_SAMPLES, AntialiasedSceneCanvas
 from .config import ViewerConfig
+from .frame_stats import FrameStats
+from .mesh_loader import ViewerMesh
+from .mesh_worker import (
+    PROGRESS_STEPS,
+    LodBuildWorker,
+    MeshLoadWorker,
+    OutlineBuildWorker,
+)
+
+MIN_CAMERA_DISTANCE = 2.0
+INTERACTIVE_TRIANGLES = 500_000
+STILL_DELAY_MS = 300
+WATCH_SETTLE_MS = 500
+AUTOPAN_STEP_SECONDS = 0.02
+MAX_AUTOPAN_ELAPSED = 0.1
+HUD_INTERVAL_MS = 500
+
+
+def release_visual(visual):
+    """
+    Detach ``visual`` and delete its GPU buffers; vispy only frees GL
+    objects on an explicit ``delete()``.
+    """
+    visual.parent = None
+    for value in vars(visual).values():
+        if isinstance(value, DataBuffer):
+            value.delete()
 
 
 def safe_slot(fn):
@@ -31,11 +63,32 @@ def safe_slot(fn):
 
 
 class ViewerWindow(QMainWindow):
-    def __init__(self, mesh: trimesh.Trimesh, config: ViewerConfig):
+    def __init__(self, mesh: Optional[ViewerMesh], config: ViewerConfig):
         super().__init__()
         self.config = config
         self.mesh = mesh
-        self.quality = getattr(self.config, "quality", 12)
+        self.load_worker: Optional[MeshLoadWorker] = None
+        self.reset_camera_on_load = mesh is None
+        self.file_path: Optional[str] = None
+        self.quiet_load = False
+        self.watched_stat: Optional[Tuple[int, int]] = None
+        self.file_watcher = QFileSystemWatcher(self)
+        self.file_watcher.fileChanged.connect(self.on_file_changed)
+        self.watch_timer = QTimer(self)
+        self.watch_timer.setSingleShot(True)
+        self.watch_timer.setInterval(WATCH_SETTLE_MS)
+        self.watch_timer.timeout.connect(self.reload_watched_file)
+        self.lod_worker: Optional[LodBuildWorker] = None
+        self.outline_worker: Optional[OutlineBuildWorker] = None
+        self.outline_source: Optional[ViewerMesh] = None
+        self.lod_source: Optional[ViewerMesh] = None
+        self.lod_levels: List[ViewerMesh] = []
+        self.lod_visuals: List[Mesh] = []
+        self.still_timer = QTimer(self)
+        self.still_timer.setSingleShot(True)
+        self.still_timer.setInterval(STILL_DELAY_MS)
+        self.still_timer.timeout.connect(self.on_view_still)
+        self.quality = getattr(self.config, "quality", DEFAULT_SAMPLES)
         self.autopan_enabled = True
         self.autopan_speed = 0.30
         self.user_interacting = False
@@ -47,24 +100,38 @@ class ViewerWindow(QMainWindow):
             "specular": 0.5,
             "shininess": 32.0,
         }
-        self.autopan_timer = QTimer(self)
-        self.autopan_timer.setInterval(20)
-        self.autopan_timer.timeout.connect(self.autopan_step)
+        self.autopan_running = False
+        self.autopan_last: Optional[float] = None
+        self.frame_stats = FrameStats()
+        self.hud_timer = QTimer(self)
+        self.hud_timer.setInterval(HUD_INTERVAL_MS)
+        self.hud_timer.timeout.connect(self.refresh_hud)
         self.autopan_action = QAction("Autopan", self)
         self.autopan_action.setCheckable(True)
         self.autopan_action.toggled.connect(self.toggle_autopan)
-        self.autopan_action.setChecked(True)
+        self.frame_stats_action = QAction("Frame Stats", self)
+        self.frame_stats_action.setCheckable(True)
+        self.frame_stats_action.toggled.connect(self.toggle_frame_stats)
+        self.watch_action = QAction("Watch File", self)
+        self.watch_action.setCheckable(True)
+        self.watch_action.toggled.connect(self.toggle_watch)
+        self.watch_action.setChecked(getattr(self.config, "watch", False))
         self.init_canvas()
+        self.autopan_action.setChecked(True)
+        if getattr(self.config, "frame_log", False):
+            self.hud_timer.start()
         self.create_menu()
         self.create_toolbar()
+        self.create_progress_bar()
         self.apply_styles()
 
     def init_canvas(self):
-        fmt = QSurfaceFormat()
-        fmt.setSamples(self.quality)
-        QSurfaceFormat.setDefaultFormat(fmt)
-        self.canvas = scene.SceneCanvas(
-            keys="interactive", show=True, bgcolor=self.config.background_color
+        self.canvas = AntialiasedSceneCanvas(
+            keys="interactive",
+            show=True,
+            bgcolor=self.config.background_color,
+            samples=self.quality,
+            vsync=True,
         )
         self.canvas.create_native()
         self.canvas.native.setMinimumSize(
@@ -73,74 +140,201 @@ class ViewerWindow(QMainWindow):
         self.setCentralWidget(self.canvas.native)
         self.setWindowTitle(f"{self.config.model_dump()['file_path']}")
         self.view = self.canvas.central_widget.add_view()
-        if not hasattr(self.mesh, "vertex_normals") or self.mesh.vertex_normals is None:
-            self.mesh.vertex_normals = self.mesh.compute_vertex_normals()
-        vertices = np.array(self.mesh.vertices, dtype=np.float32)
-        faces = np.array(self.mesh.faces)
-        self.mesh_visual = Mesh(
-            vertices=vertices,
-            faces=faces,
-            color=(0.5, 0.5, 1, 1),
-        )
+        self.mesh_visual = Mesh(color=(0.5, 0.5, 1, 1))
         self.view.add(self.mesh_visual)
-        self.border_mesh = self.create_border_mesh(vertices, faces, scale=1.02)
-        self.border_mesh.visible = False
-        self.view.add(self.border_mesh)
-        min_distance = 2.0
-        computed_distance = self.mesh.extents.max() * 5
+        self.outline_visual = self.create_outline()
+        self.outline_visual.visible = False
+        self.view.add(self.outline_visual)
         self.view.camera = scene.TurntableCamera(
-            fov=self.config.fov, distance=max(computed_distance, min_distance)
+            fov=self.config.fov, distance=MIN_CAMERA_DISTANCE
         )
-        self.view.camera.center = self.mesh.centroid
         self.axis = XYZAxis(parent=self.view.scene)
         self.canvas.events.mouse_press.connect(self.on_mouse_press)
         self.canvas.events.mouse_release.connect(self.on_mouse_release)
+        self.canvas.events.mouse_move.connect(self.on_mouse_move)
+        self.canvas.events.mouse_wheel.connect(self.on_camera_moved)
+        self.canvas.events.draw.connect(self.on_draw_begin, position="first")
+        self.canvas.events.draw.connect(self.on_draw_end, position="last")
+        self.hud = Text(
+            "",
+            parent=self.canvas.scene,
+            color="white",
+            font_size=9,
+            anchor_x="left",
+            anchor_y="bottom",
+            pos=(10, 20),
+        )
+        self.hud.visible = False
+        if self.mesh is not None:
+            self.show_mesh(self.mesh, reset_camera=True)
+        self.update_lighting()
+
+    def show_mesh(self, mesh: ViewerMesh, reset_camera: bool = False):
+        """
+        Replace the displayed geometry, optionally re-aiming the camera.
+        """
+        if mesh is not self.lod_source:
+            self.clear_lods()
+        self.mesh = mesh
+        self.mesh_visual.set_data(vertices=mesh.vertices, faces=mesh.faces)
+        self.frame_stats.count_upload(mesh.vertices.nbytes + mesh.faces.nbytes)
+        if self.outline_visual.visible:
+            self.build_outline()
+        if reset_camera:
+            self.view.camera.center = mesh.centroid
+            self.view.camera.distance = max(
+                mesh.extents.max() * 5, MIN_CAMERA_DISTANCE
+            )
+        self.canvas.update()
+
+    def build_lods(self):
+        """
+        Decimate the current mesh in the background for use while the
+        camera moves (see ``set_detail``).
+        """
+        worker = LodBuildWorker(self.mesh, self)
+        worker.built.connect(self.on_lods_built)
+        worker.finished.connect(worker.deleteLater)
+        self.lod_worker = worker
+        self.lod_source = self.mesh
+        worker.start()
+
+    @safe_slot
+    def on_lods_built(self, levels: List[ViewerMesh]):
+        if self.sender() is not self.lod_worker:
+            return
+        self.lod_worker = None
+        self.lod_levels = levels
+        self.attach_lods()
+
+    def attach_lods(self):
+        for level in self.lod_levels[len(self.lod_visuals) :]:
+            visual = Mesh(
+                vertices=level.vertices,
+                faces=level.faces,
+                color=self.mesh_visual.color,
+            )
+            visual.visible = False
+            self.view.add(visual)
+            self.frame_stats.count_upload(level.vertices.nbytes + level.faces.nbytes)
+            self.lod_visuals.append(visual)
         self.update_lighting()
 
+    def clear_lods(self):
+        self.set_detail(coarse=False)
+        for visual in self.lod_visuals:
+            release_visual(visual)
+        self.lod_visuals = []
+        self.lod_levels = []
+        self.lod_source = None
+        self.lod_worker = None
+
+    def coarse_visual(self) -> Optional[Mesh]:
+        """
+        The finest level cheap enough to redraw every frame, else the
+        coarsest one; None before any level is built.
+        """
+        for level, visual in zip(self.lod_levels, self.lod_visuals):
+            if len(level.faces) <= INTERACTIVE_TRIANGLES:
+                return visual
+        return self.lod_visuals[-1] if self.lod_visuals else None
+
+    def set_detail(self, coarse: bool):
+        coarse_visual = self.coarse_visual()
+        if coarse_visual is None:
+            return
+        for visual in self.lod_visuals:
+            visual.visible = coarse and visual is coarse_visual
+        self.mesh_visual.visible = not coarse
+        self.canvas.update()
+
+    def on_camera_moved(self, *args, **kwargs):
+        """
+        Draw the coarse level until the view has been still for
+        ``STILL_DELAY_MS``.
+        """
+        self.set_detail(coarse=True)
+        self.still_timer.start()
+
+    def on_view_still(self):
+        self.set_detail(coarse=False)
+
+    def on_mouse_move(self, event):
+        if event.is_dragging:
+            self.on_camera_moved()
+
     def update_lighting(self):
+        for visual in [self.mesh_visual] + self.lod_visuals:
+            self.apply_lighting(visual)
+
+    def apply_lighting(self, visual):
         try:
-            self.mesh_visual.shared_program["u_ambient"] = self.environment_light.get(
+            visual.shared_program["u_ambient"] = self.environment_light.get(
                 "ambient", 0.3
             )
-            self.mesh_visual.shared_program["u_light_color"] = (
+            visual.shared_program["u_light_color"] = (
                 self.environment_light.get("color", (1, 1, 1, 1))
             )
-            self.mesh_visual.shared_program["u_light_intensity"] = (
+            visual.shared_program["u_light_intensity"] = (
                 self.environment_light.get("intensity", 1.0)
             )
-            self.mesh_visual.shared_program["u_light_direction"] = (
+            visual.shared_program["u_light_direction"] = (
                 self.environment_light.get("direction", (0, 0, -1))
             )
-            self.mesh_visual.shared_program["u_specular"] = self.environment_light.get(
+            visual.shared_program["u_specular"] = self.environment_light.get(
                 "specular", 0.5
             )
-            self.mesh_visual.shared_program["u_shininess"] = self.environment_light.get(
+            visual.shared_program["u_shininess"] = self.environment_light.get(
                 "shininess", 32.0
             )
         except Exception:
             pass
 
-    def create_border_mesh(self, vertices, faces, scale=1.02):
-        border_vertices = vertices * scale
-        border_mesh = Mesh(
-            vertices=border_vertices,
-            faces=faces,
-            color=(0, 0, 0, 1),
-            mode="lines",
+    def create_outline(self):
+        outline = Line(color=(0, 0, 0, 1), connect="segments", method="gl")
+        outline.set_gl_state(depth_test=False)
+        outline.order = 10
+        return outline
+
+    def build_outline(self):
+        """
+        Extract the current mesh's feature edges in the background; the
+        result is cached per mesh, so toggling the outline again is free.
+        """
+        if self.mesh is None or self.outline_source is self.mesh:
+            return
+        worker = OutlineBuildWorker(
+            self.mesh, getattr(self.config, "outline_angle", 30.0), self
         )
-        border_mesh.set_gl_state(depth_test=False)
-        border_mesh.order = 10
-        return border_mesh
-
-    def recreate_canvas(self):
-        camera_center = self.view.camera.center
-        camera_distance = self.view.camera.distance
-        camera_fov = self.view.camera.fov
-        self.canvas.close()
-        self.init_canvas()
-        self.view.camera.center = camera_center
-        self.view.camera.distance = camera_distance
-        self.view.camera.fov = camera_fov
+        worker.built.connect(self.on_outline_built)
+        worker.failed.connect(self.on_outline_failed)
+        worker.finished.connect(worker.deleteLater)
+        self.outline_worker = worker
+        self.outline_source = self.mesh
+        worker.start()
+
+    @safe_slot
+    def on_outline_built(self, segments):
+        if self.sender() is not self.outline_worker:
+            return
+        self.outline_worker = None
+        if len(segments):
+            self.outline_visual.set_data(pos=segments)
+            self.frame_stats.count_upload(segments.nbytes)
+        else:
+            self.outline_visual.set_data(pos=np.zeros((2, 3), dtype=np.float32))
+        self.canvas.update()
+
+    @safe_slot
+    def on_outline_failed(self, message: str):
+        if self.sender() is not self.outline_worker:
+            return
+        self.outline_worker = None
+        # Let the next toggle or mesh change try again.
+        self.outline_source = None
+        self.outline_visual.set_data(pos=np.zeros((2, 3), dtype=np.float32))
+        self.statusBar().showMessage(f"Outline failed: {message}", 5000)
+        self.canvas.update()
 
     def create_toolbar(self):
         toolbar = QToolBar("Main Toolbar")
@@ -155,6 +349,8 @@ class ViewerWindow(QMainWindow):
         change_model_color_action.triggered.connect(self.change_model_color)
         toolbar.addAction(change_model_color_action)
         toolbar.addAction(self.autopan_action)
+        toolbar.addAction(self.watch_action)
+        toolbar.addAction(self.frame_stats_action)
         set_autopan_speed_action = QAction("Set Autopan Speed", self)
         set_autopan_speed_action.triggered.connect(self.set_autopan_speed)
         toolbar.addAction(set_autopan_speed_action)
@@ -181,6 +377,137 @@ class ViewerWindow(QMainWindow):
         exit_action.triggered.connect(self.close)
         toolbar.addAction(exit_action)
 
+    def create_progress_bar(self):
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setVisible(False)
+        self.statusBar().addPermanentWidget(self.progress_bar)
+
+    def load_file(self, file_path: str, hot_reload: bool = False):
+        """
+        Load ``file_path`` in a background thread. A coarse preview is shown
+        as soon as it is read and replaced by the full mesh when done; the
+        camera is re-aimed once per load.
+
+        A ``hot_reload`` keeps the camera, skips the preview and reports
+        failures in the status bar instead of a dialog.
+        """
+        worker = MeshLoadWorker(file_path, self, with_preview=not hot_reload)
+        worker.preview.connect(self.on_mesh_preview)
+        worker.progress.connect(self.on_load_progress)
+        worker.loaded.connect(self.on_mesh_loaded)
+        worker.failed.connect(self.on_mesh_failed)
+        worker.finished.connect(worker.deleteLater)
+        self.load_worker = worker
+        self.reset_camera_on_load = not hot_reload
+        self.quiet_load = hot_reload
+        if file_path != self.file_path:
+            self.unwatch_file()
+            self.file_path = file_path
+            self.watch_file()
+        self.setWindowTitle(file_path)
+        # Indeterminate until the loader reports progress.
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        self.statusBar().showMessage(f"Loading {file_path}...")
+        worker.start()
+
+    @safe_slot
+    def on_mesh_preview(self, mesh: ViewerMesh):
+        if self.sender() is not self.load_worker:
+            return
+        self.show_mesh(mesh, reset_camera=self.reset_camera_on_load)
+        self.reset_camera_on_load = False
+        self.statusBar().showMessage(
+            f"Preview: {len(mesh.faces)} triangles, loading full resolution..."
+        )
+
+    @safe_slot
+    def on_load_progress(self, percent: int):
+        if self.sender() is not self.load_worker:
+            return
+        self.progress_bar.setRange(0, PROGRESS_STEPS)
+        self.progress_bar.setValue(percent)
+
+    @safe_slot
+    def on_mesh_loaded(self, mesh: ViewerMesh):
+        if self.sender() is not self.load_worker:
+            return
+        self.load_worker = None
+        self.progress_bar.setVisible(False)
+        self.show_mesh(mesh, reset_camera=self.reset_camera_on_load)
+        self.reset_camera_on_load = False
+        self.statusBar().showMessage(f"{len(mesh.faces)} triangles", 5000)
+        self.build_lods()
+
+    @safe_slot
+    def on_mesh_failed(self, message: str):
+        if self.sender() is not self.load_worker:
+            return
+        self.load_worker = None
+        self.progress_bar.setVisible(False)
+        if self.quiet_load:
+            self.statusBar().showMessage(f"Reload failed: {message}")
+            return
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Error", f"Failed to load mesh:\n{message}")
+
+    def file_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def watch_file(self):
+        if self.watch_action.isChecked() and self.file_path is not None:
+            if os.path.exists(self.file_path):
+                self.file_watcher.addPath(self.file_path)
+            self.watched_stat = self.file_stat()
+
+    def unwatch_file(self):
+        self.watch_timer.stop()
+        files = self.file_watcher.files()
+        if files:
+            self.file_watcher.removePaths(files)
+
+    @safe_slot
+    def toggle_watch(self, enabled, *args, **kwargs):
+        if enabled:
+            self.watch_file()
+        else:
+            self.unwatch_file()
+
+    def on_file_changed(self, path: str):
+        # Exporters that replace the file drop it from the watcher.
+        if path not in self.file_watcher.files() and os.path.exists(path):
+            self.file_watcher.addPath(path)
+        self.watched_stat = self.file_stat()
+        self.watch_timer.start()
+
+    def reload_watched_file(self):
+        """
+        Reload the watched file once it has stopped changing for
+        ``WATCH_SETTLE_MS`` and no other load is running.
+        """
+        stat = self.file_stat()
+        if (
+            stat is None
+            or stat != self.watched_stat
+            or self.load_worker is not None
+        ):
+            self.watched_stat = stat
+            self.watch_timer.start()
+            return
+        self.load_file(self.file_path, hot_reload=True)
+
+    def closeEvent(self, event):  # pylint: disable=invalid-name
+        # A QThread must not be destroyed while running, including workers
+        # whose results are no longer wanted.
+        for worker in self.findChildren(QThread):
+            worker.wait()
+        super().closeEvent(event)
+
     def create_menu(self):
         menu_bar: QMenuBar = self.menuBar()
         file_menu = menu_bar.addMenu("File")
@@ -205,6 +532,8 @@ class ViewerWindow(QMainWindow):
         change_model_color_action.triggered.connect(self.change_model_color)
         view_menu.addAction(change_model_color_action)
         view_menu.addAction(self.autopan_action)
+        view_menu.addAction(self.watch_action)
+        view_menu.addAction(self.frame_stats_action)
         set_autopan_speed_action = QAction("Set Autopan Speed", self)
         set_autopan_speed_action.triggered.connect(self.set_autopan_speed)
         view_menu.addAction(set_autopan_speed_action)
@@ -228,7 +557,9 @@ class ViewerWindow(QMainWindow):
 
     @safe_slot
     def toggle_border(self, enabled):
-        self.border_mesh.visible = enabled
+        self.outline_visual.visible = enabled
+        if enabled:
+            self.build_outline()
         self.canvas.update()
 
     def apply_styles(self):
@@ -315,23 +646,32 @@ class ViewerWindow(QMainWindow):
         color = QColorDialog.getColor()
         if color.isValid():
             new_color = color.getRgbF()
-            self.mesh_visual.color = new_color
+            for visual in [self.mesh_visual] + self.lod_visuals:
+                visual.color = new_color
             self.canvas.update()
 
     @safe_slot
     def toggle_autopan(self, enabled, *args, **kwargs):
         self.autopan_enabled = enabled
         if enabled and not self.user_interacting:
-            self.autopan_timer.start()
+            self.start_autopan()
         else:
-            self.autopan_timer.stop()
+            self.stop_autopan()
+
+    def start_autopan(self):
+        self.autopan_running = True
+        self.autopan_last = None
+        self.canvas.update()
+
+    def stop_autopan(self):
+        self.autopan_running = False
 
     @safe_slot
     def set_autopan_speed(self, *args, **kwargs):
         speed, ok = QInputDialog.getDouble(
             self,
             "Set Autopan Speed",
-            "Degrees per step:",
+            "Degrees per step (20 ms):",
             self.autopan_speed,
             -360,
             360,
@@ -342,24 +682,76 @@ class ViewerWindow(QMainWindow):
 
     @safe_slot
     def autopan_step(self, *args, **kwargs):
-        self.view.camera.azimuth += self.autopan_speed
+        """
+        Turn the camera by the time since the previous frame, so the speed
+        does not depend on the frame rate, and request the next frame.
+        """
+        if not self.autopan_running or self.isMinimized() or not self.isVisible():
+            return
+        now = time.perf_counter()
+        if self.autopan_last is None:
+            elapsed = AUTOPAN_STEP_SECONDS
+        else:
+            elapsed = min(now - self.autopan_last, MAX_AUTOPAN_ELAPSED)
+        self.autopan_last = now
+        self.view.camera.azimuth += self.autopan_speed * elapsed / AUTOPAN_STEP_SECONDS
+        self.on_camera_moved()
         self.canvas.update()
 
+    def on_draw_begin(self, event):
+        self.frame_stats.triangles = self.displayed_triangles()
+        self.frame_stats.begin_frame()
+
+    def on_draw_end(self, event):
+        self.frame_stats.end_frame()
+        if self.autopan_running:
+            # One step per presented frame: swaps are vsync-paced, and
+            # hidden or minimized windows are not painted, so the
+            # animation pauses with them and resumes on the next expose.
+            QTimer.singleShot(0, self.autopan_step)
+
+    def displayed_triangles(self) -> int:
+        if self.mesh is None:
+            return 0
+        for level, visual in zip(self.lod_levels, self.lod_visuals):
+            if visual.visible:
+                return len(level.faces)
+        return len(self.mesh.faces)
+
+    @safe_slot
+    def toggle_frame_stats(self, enabled, *args, **kwargs):
+        self.hud.visible = enabled
+        if enabled or getattr(self.config, "frame_log", False):
+            self.hud_timer.start()
+        else:
+            self.hud_timer.stop()
+        self.refresh_hud()
+
+    def refresh_hud(self):
+        if self.isMinimized() or not self.isVisible():
+            return
+        text = self.frame_stats.format()
+        if getattr(self.config, "frame_log", False):
+            print(text)
+        if self.hud.visible:
+            self.hud.text = text
+            self.canvas.update()
+
     def on_mouse_press(self, event):
-        if event.button == 1 and self.autopan_timer.isActive():
-            self.autopan_timer.stop()
+        if event.button == 1 and self.autopan_running:
+            self.stop_autopan()
             self.user_interacting = True
 
     def on_mouse_release(self, event):
         if event.button == 1 and self.user_interacting and self.autopan_enabled:
-            self.autopan_timer.start()
+            self.start_autopan()
             self.user_interacting = False
 
     @safe_slot
     def increase_quality(self, *args, **kwargs):
         if self.quality < 16:
             self.quality += 1
-            self.recreate_canvas()
+            self.canvas.samples = self.quality
             QMessageBox.information(
                 self, "Quality Updated", f"Quality increased to {self.quality} samples."
             )
@@ -368,7 +760,7 @@ class ViewerWindow(QMainWindow):
     def decrease_quality(self, *args, **kwargs):
         if self.quality > 0:
             self.quality -= 1
-            self.recreate_canvas()
+            self.canvas.samples = self.quality
             QMessageBox.information(
                 self, "Quality Updated", f"Quality decreased to {self.quality} samples."
             )
@@ -399,19 +791,7 @@ class ViewerWindow(QMainWindow):
             "3D Model Files (*.stl *.obj *.ply *.off);;All Files (*)",
         )
         if filename:
-            new_mesh = trimesh.load(filename)
-            if isinstance(new_mesh, trimesh.Scene):
-                new_mesh = trimesh.util.concatenate(list(new_mesh.geometry.values()))
-            self.mesh = new_mesh
-            self.mesh_visual.set_data(vertices=new_mesh.vertices, faces=new_mesh.faces)
-            self.view.camera.center = new_mesh.centroid
-            self.view.camera.distance = new_mesh.extents.max() * 2
-            vertices = np.array(new_mesh.vertices, dtype=np.float32)
-            faces = np.array(new_mesh.faces)
-            self.border_mesh = self.create_border_mesh(vertices, faces, scale=1.02)
-            self.border_mesh.visible = False
-            self.view.add(self.border_mesh)
-            self.canvas.update()
+            self.load_file(filename)
 
     @safe_slot
     def configure_environment_light(self, *args, **kwargs):
@@ -8,31 +8,34 @@ from pydantic import ValidationError
 from PyQt5.QtWidgets import QApplication
 
 from viewer.lib.config import ViewerConfig
-from viewer.lib.mesh_loader import load_mesh
 from viewer.lib.ui import ViewerWindow
 
 
 def main():
     app.use_app("pyqt5")
 
+    # --watch reloads the model whenever it is re-exported; --frame-log
+    # prints frame-time statistics twice a second.
+    flags = {}
+    for flag, field in (("--watch", "watch"), ("--frame-log", "frame_log")):
+        flags[field] = flag in sys.argv[1:]
+        if flags[field]:
+            sys.argv.remove(flag)
     if len(sys.argv) < 2:
         sys.argv.append("./target/model.stl")
 
     try:
-        config = ViewerConfig(file_path=sys.argv[1])
+        config = ViewerConfig(file_path=sys.argv[1], **flags)
     except ValidationError as err:
         print("Configuration error:", err)
         sys.exit(1)
 
-    try:
-        mesh = load_mesh(str(config.file_path))
-    except Exception as e:
-        print(f"Failed to load mesh: {e}")
-        sys.exit(1)
     qt_app = QApplication(sys.argv)
 
-    window = ViewerWindow(mesh, config)
+    # The mesh is loaded in the background so the window appears at once.
+    window = ViewerWindow(None, config)
     window.show()
+    window.load_file(str(config.file_path))
 
     try:
         qt_app.exec_()